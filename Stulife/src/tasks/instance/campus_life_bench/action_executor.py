@@ -28,6 +28,22 @@ except ImportError:
         from tasks.instance.campus_life_bench.environment import CampusEnvironment
 
 
+# Compiled once: every executed action goes through these patterns
+_ACTION_CALL_RE = re.compile(r'([^(]+)\((.*)\)')
+
+# Fallback parameter patterns for _parse_parameters_fallback, as (pattern, converter)
+_FALLBACK_PARAM_PATTERNS = [
+    # String values: key="value" or key='value'
+    (re.compile(r'(\w+)\s*=\s*["\']([^"\']*)["\']'), str),
+    # Boolean values: key=True or key=False
+    (re.compile(r'(\w+)\s*=\s*(True|False)'), lambda x: x == 'True'),
+    # Numeric values: key=123 or key=123.45
+    (re.compile(r'(\w+)\s*=\s*(\d+\.?\d*)'), lambda x: float(x) if '.' in x else int(x)),
+    # Dictionary values: key={"a": "b"} (simplified)
+    (re.compile(r'(\w+)\s*=\s*(\{[^}]*\})'), lambda x: eval(x) if x.startswith('{') else x),
+]
+
+
 class ActionExecutor:
     """
     Executes Action: formatted commands by mapping them to environment methods
@@ -211,7 +227,7 @@ class ActionExecutor:
             Tuple of (action_name, parameters_dict)
         """
         # Extract action name and parameters
-        match = re.match(r'([^(]+)\((.*)\)', action_content.strip())
+        match = _ACTION_CALL_RE.match(action_content.strip())
         if not match:
             raise ValueError(f"Invalid action format: {action_content}")
         
@@ -317,19 +333,8 @@ class ActionExecutor:
         params = {}
 
         # Enhanced regex patterns for different value types
-        patterns = [
-            # String values: key="value" or key='value'
-            (r'(\w+)\s*=\s*["\']([^"\']*)["\']', str),
-            # Boolean values: key=True or key=False
-            (r'(\w+)\s*=\s*(True|False)', lambda x: x == 'True'),
-            # Numeric values: key=123 or key=123.45
-            (r'(\w+)\s*=\s*(\d+\.?\d*)', lambda x: float(x) if '.' in x else int(x)),
-            # Dictionary values: key={"a": "b"} (simplified)
-            (r'(\w+)\s*=\s*(\{[^}]*\})', lambda x: eval(x) if x.startswith('{') else x),
-        ]
-
-        for pattern, converter in patterns:
-            matches = re.findall(pattern, params_str)
+        for pattern, converter in _FALLBACK_PARAM_PATTERNS:
+            matches = pattern.findall(params_str)
             for key, value in matches:
                 if key not in params:  # Don't override already parsed values
                     try:
@@ -99,6 +99,18 @@ class CampusEnvironment:
         # self.calendar_system.daily_reset()
         # self.reservation_system.daily_reset()
     
+    def reset_for_test(self) -> None:
+        """
+        Restore every stateful subsystem to its initial state (for testing purposes only)
+        Static data (map, bibliography, campus data, courses) is kept, so no files are re-read
+        """
+        self._current_day = None
+        self.calendar_system.reset()
+        self.geography_system.daily_reset()
+        self.reservation_system.reset()
+        self.course_selection_system.reset()
+        self.email_system.clear_emails()
+    
     def set_initial_location(self, building_id: str) -> ToolResult:
         """
         Set agent's initial location for a task
@@ -4,7 +4,7 @@ Generates dynamic system prompts based on available systems
 All natural language communications/returns MUST use English only
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 import sys
 import os
 
@@ -27,6 +27,9 @@ class SystemPromptGenerator:
     """
     Generates system prompts with tool declarations based on available systems
     """
+
+    # Prompts keyed by (generator class, ordered system names), shared by every instance
+    _prompt_cache: Dict[Tuple[type, Tuple[str, ...]], str] = {}
     
     def __init__(self):
         """Initialize system prompt generator"""
@@ -46,8 +49,16 @@ class SystemPromptGenerator:
             Complete system prompt string
         """
         if available_systems is None:
-            available_systems = list(self.system_descriptions.keys())
+            available_systems = self.system_descriptions.keys()
+
+        key = (type(self), tuple(available_systems))
+        prompt = self._prompt_cache.get(key)
+        if prompt is None:
+            prompt = self._prompt_cache[key] = self._build_prompt(key[1])
+        return prompt
 
+    def _build_prompt(self, available_systems: Tuple[str, ...]) -> str:
+        """Assemble the prompt for an ordered tuple of system names"""
         # Build the prompt
         prompt_parts = [self.base_prompt]
 
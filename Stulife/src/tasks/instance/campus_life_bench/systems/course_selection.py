@@ -37,18 +37,22 @@ class CourseSelectionSystem:
     Supports course browsing, draft management, and final registration
     """
     
-    def __init__(self, courses_data_path: Path):
+    def __init__(self, courses_data_path: Optional[Path], courses_data: Optional[Dict[str, Any]] = None):
         """
         Initialize course selection system
         
         Args:
             courses_data_path: Path to courses data JSON file
+            courses_data: Already parsed course data; skips reading courses_data_path
         """
         self.courses_data_path = courses_data_path
         
         # Load course data
         self._courses_data: Dict[str, Any] = {}
-        self._load_courses_data()
+        if courses_data is not None:
+            self._courses_data = courses_data
+        else:
+            self._load_courses_data()
         
         # Course states (popularity and seats)
         self._course_states: Dict[str, CourseState] = {}
@@ -57,6 +61,29 @@ class CourseSelectionSystem:
         # Agent's draft schedule
         self._draft_schedule = DraftSchedule(selected_sections=[])
     
+    @classmethod
+    def from_dict(cls, courses_data: Dict[str, Any]) -> "CourseSelectionSystem":
+        """
+        Create a course selection system from in-memory course data
+        
+        Args:
+            courses_data: Course data in the courses JSON format; it is only read,
+                          so several systems may share one dict
+        
+        Returns:
+            CourseSelectionSystem with a fresh draft and course states
+        """
+        return cls(None, courses_data=courses_data)
+    
+    def reset(self) -> None:
+        """
+        Restore the freshly initialized state (for testing purposes only)
+        Empties the draft and restores course states from the loaded course data
+        """
+        self._course_states.clear()
+        self._initialize_course_states()
+        self._draft_schedule = DraftSchedule(selected_sections=[])
+    
     def _load_courses_data(self):
         """Load courses data from JSON file"""
         try:
@@ -139,29 +166,26 @@ class CourseSelectionSystem:
         """
         try:
             courses = []
+            filters = filters or {}
+            
+            # Parse the filters once rather than for every course
+            max_credits = None
+            credit_filter = filters.get("credits")
+            if isinstance(credit_filter, str) and "<=" in credit_filter:
+                max_credits = int(credit_filter.split("<=")[1].strip())
+            code_filter = str(filters["course_code"]) if "course_code" in filters else None
+            name_filter = str(filters["course_name"]).lower() if "course_name" in filters else None
             
             for course in self._courses_data.get("courses", []):
                 course_code = course["course_code"]
                 
                 # Apply filters if provided
-                if filters:
-                    # Simple filter implementation - can be extended
-                    if "credits" in filters:
-                        credit_filter = filters["credits"]
-                        if isinstance(credit_filter, str) and "<=" in credit_filter:
-                            max_credits = int(credit_filter.split("<=")[1].strip())
-                            if course["credits"] > max_credits:
-                                continue
-                    
-                    if "course_code" in filters:
-                        code_filter = str(filters["course_code"])
-                        if code_filter not in course.get("course_code", ""):
-                            continue
-                            
-                    if "course_name" in filters:
-                        name_filter = str(filters["course_name"])
-                        if name_filter.lower() not in course.get("course_name", "").lower():
-                            continue
+                if max_credits is not None and course["credits"] > max_credits:
+                    continue
+                if code_filter is not None and code_filter not in course.get("course_code", ""):
+                    continue
+                if name_filter is not None and name_filter not in course.get("course_name", "").lower():
+                    continue
                 
                 # Get current state
                 state = self._course_states.get(course_code, CourseState(50, 50))
@@ -176,7 +200,7 @@ class CourseSelectionSystem:
                 return ToolResult.failure("No courses found matching the specified criteria.")
             
             # Format course list for display
-            message = f"Found {len(courses)} course(s):"
+            lines = [f"Found {len(courses)} course(s):"]
             for course in courses:
                 schedule_info = course.get("schedule", {})
                 weeks = schedule_info.get("weeks", {})
@@ -184,11 +208,12 @@ class CourseSelectionSystem:
                 instructor = course.get("instructor", {})
                 days = ", ".join(schedule_info.get("days", []))
 
-                message += f"\n- {course['course_code']}: {course['course_name']}"
-                message += f" (Credits: {course.get('credits', 'N/A')}, Popularity: {course.get('popularity_index', 'N/A')})"
-                message += f"\n  Instructor: {instructor.get('name', 'N/A')}"
-                message += f"\n  Schedule: Weeks {weeks.get('start', '?')}-{weeks.get('end', '?')}, {days}, {schedule_info.get('time', 'N/A')}"
-                message += f"\n  Location: {location.get('building_name', 'N/A')}, {location.get('room', location.get('room_number', 'N/A'))}"
+                lines.append(f"- {course['course_code']}: {course['course_name']}"
+                             f" (Credits: {course.get('credits', 'N/A')}, Popularity: {course.get('popularity_index', 'N/A')})")
+                lines.append(f"  Instructor: {instructor.get('name', 'N/A')}")
+                lines.append(f"  Schedule: Weeks {weeks.get('start', '?')}-{weeks.get('end', '?')}, {days}, {schedule_info.get('time', 'N/A')}")
+                lines.append(f"  Location: {location.get('building_name', 'N/A')}, {location.get('room', location.get('room_number', 'N/A'))}")
+            message = "\n".join(lines)
 
             return ToolResult.success(ensure_english_message(message), {"courses": courses})
             
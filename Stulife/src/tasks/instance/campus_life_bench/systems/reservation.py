@@ -51,6 +51,15 @@ class ReservationSystem:
         # Configured availability from world_state_change
         self._configured_availability: Dict[str, Any] = {}
     
+    def reset(self) -> None:
+        """
+        Restore the freshly initialized state (for testing purposes only)
+        Drops all reservations, the task context and configured availability
+        """
+        self._global_reservations.clear()
+        self._current_task_context = None
+        self._configured_availability.clear()
+    
     def set_availability(self, parameters: Dict[str, Any]) -> None:
         """
         Set pre-configured availability for a location/item.
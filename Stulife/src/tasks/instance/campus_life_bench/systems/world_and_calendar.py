@@ -91,21 +91,28 @@ class CalendarSystem:
     def __init__(self):
         """Initialize the calendar system"""
         # Global calendars dictionary: calendar_id -> List[CalendarEvent]
-        self._global_calendars: Dict[str, List[CalendarEvent]] = {
-            "self": []  # Personal calendar starts empty
-        }
+        self._global_calendars: Dict[str, List[CalendarEvent]] = {}
         self._self_schedule_changes: List[Dict[str, Any]] = []
-
-        # Permission mapping
-        self._permissions = {
-            "self": {"add", "remove", "update", "view"},
-            # Club calendars have add and view permissions
-            # Advisor calendars have query_availability permission only
-        }
-
+        # Permission mapping: calendar_id -> allowed operations
+        self._permissions: Dict[str, set] = {}
         # Advisor availability settings from world_state_change
         # Format: {advisor_id: {date: [available_slots]}}
         self._advisor_availability_settings: Dict[str, Dict[str, List[str]]] = {}
+        self.reset()
+    
+    def reset(self) -> None:
+        """
+        Restore the freshly initialized state (also called by __init__)
+        Drops all events, lazily created calendars and advisor availability
+        """
+        self._global_calendars.clear()
+        self._global_calendars["self"] = []  # Personal calendar starts empty
+        self._self_schedule_changes.clear()
+        self._permissions.clear()
+        # Club calendars have add and view permissions
+        # Advisor calendars have query_availability permission only
+        self._permissions["self"] = {"add", "remove", "update", "view"}
+        self._advisor_availability_settings.clear()
     
     def _is_date_match(self, query_date: str, event_time: str) -> bool:
         """
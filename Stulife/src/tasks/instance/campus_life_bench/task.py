@@ -41,6 +41,14 @@ from .action_executor import ActionExecutor
 from .system_prompt_generator import SystemPromptGenerator
 
 
+# Agent response patterns used by CampusTask._parse_agent_response, compiled once at import
+_ACTION_TAG_RE = re.compile(r'<action>(.*?)</action>', re.DOTALL | re.IGNORECASE)
+_ANSWER_RE = re.compile(r'Answer:\s*([A-Za-z])\s*$', re.MULTILINE | re.IGNORECASE)
+_ACTION_LINE_RE = re.compile(r'Action:\s*([^(]+)\((.*)\)$', re.DOTALL)
+_ACTION_FALLBACK_RE = re.compile(r'Action:\s*([^(]+)\((.*?)\)', re.DOTALL | re.MULTILINE)
+_FINISH_FALLBACK_RE = re.compile(r'\bfinish\s*\(\s*\)', re.IGNORECASE)
+
+
 class ContextInjectionState(Enum):
     """States for context injection state machine"""
     SYSTEM_PROMPT_SENT = "system_prompt_sent"
@@ -349,15 +357,13 @@ class CampusTask(Task[CampusDatasetItem]):
             Parsed result with action and content (only first valid action found)
         """
         # First, extract content from <action> tags if present
-        action_tag_pattern = r'<action>(.*?)</action>'
-        action_tag_match = re.search(action_tag_pattern, agent_response, re.DOTALL | re.IGNORECASE)
+        action_tag_match = _ACTION_TAG_RE.search(agent_response)
         
         # Use content inside <action> tags if found, otherwise use the full response
         content_to_parse = action_tag_match.group(1).strip() if action_tag_match else agent_response
         
         # Look for Answer: pattern first (for quiz questions)
-        answer_pattern = r'Answer:\s*([A-Za-z])\s*$'
-        answer_match = re.search(answer_pattern, content_to_parse, re.MULTILINE | re.IGNORECASE)
+        answer_match = _ANSWER_RE.search(content_to_parse)
 
         if answer_match:
             answer_letter = answer_match.group(1).upper()
@@ -378,20 +384,23 @@ class CampusTask(Task[CampusDatasetItem]):
 
         # Look for Action: pattern (for regular tasks)
         # Use balanced parentheses matching to handle nested parentheses correctly
-        action_pattern = r'Action:\s*([^(]+)\((.*)\)$'
         # First try to match the entire line for better parsing
         lines = content_to_parse.strip().split('\n')
         action_match = None
         for line in lines:
-            if line.strip().startswith('Action:'):
-                action_match = re.search(action_pattern, line.strip(), re.DOTALL)
+            line = line.strip()
+            if line.startswith('Action:'):
+                action_match = _ACTION_LINE_RE.search(line)
                 if action_match:
                     break
         
         # Fallback to original pattern if line-by-line fails
         if not action_match:
-            action_pattern = r'Action:\s*([^(]+)\((.*?)\)'
-            action_match = re.search(action_pattern, content_to_parse, re.DOTALL | re.MULTILINE)
+            action_match = _ACTION_FALLBACK_RE.search(content_to_parse)
+
+        # "Action: (...)" names no tool, so it is not a valid action
+        if action_match and not action_match.group(1).strip():
+            action_match = None
 
         if action_match:
             action_name = action_match.group(1).strip()
@@ -413,7 +422,7 @@ class CampusTask(Task[CampusDatasetItem]):
             )
 
         # Fallback: Look for finish keyword (backward compatibility)
-        if re.search(r'\bfinish\s*\(\s*\)', content_to_parse, re.IGNORECASE):
+        if _FINISH_FALLBACK_RE.search(content_to_parse):
             return AgentResponseParserResult(
                 action=AgentAction.FINISH,
                 content=None,
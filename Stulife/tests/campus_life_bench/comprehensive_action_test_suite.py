@@ -18,6 +18,7 @@ import sys
 import os
 import time
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 
@@ -33,6 +34,21 @@ from tasks.instance.campus_life_bench.system_prompt_generator import SystemPromp
 from tasks.instance.campus_life_bench.environment import CampusEnvironment
 from tasks.instance.campus_life_bench.tools import ToolResult, ToolResultStatus
 
+# CLB_TEST_DATA_DIR lets CI point the suite at a copy of test_data, e.g. on tmpfs
+TEST_DATA_DIR = os.environ.get("CLB_TEST_DATA_DIR") or os.path.join(current_dir, 'test_data')
+
+
+@lru_cache(maxsize=None)
+def _load_json_file(path: Path, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a JSON file once per modification time; callers share the result read-only"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _read_json(path: Path) -> Dict[str, Any]:
+    """Load a test data file, re-parsing it only after it has been edited"""
+    return _load_json_file(path, path.stat().st_mtime_ns)
+
 
 class TestDataLoader:
     """Utility class for loading test data"""
@@ -49,17 +65,14 @@ class TestDataLoader:
         original_file = self.test_data_dir / "comprehensive_test_tasks.json"
 
         if corrected_file.exists():
-            with open(corrected_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return _read_json(corrected_file)
         else:
-            with open(original_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return _read_json(original_file)
     
     def _load_background_data(self) -> Dict[str, Any]:
         """Load background data for realistic simulation"""
         bg_file = self.test_data_dir / "background_data.json"
-        with open(bg_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return _read_json(bg_file)
     
     def get_test_category(self, category: str) -> Dict[str, Any]:
         """Get tests for a specific category"""
@@ -141,7 +154,7 @@ class SingleSystemTests(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         """Set up test environment"""
-        cls.test_data_dir = os.path.join(os.path.dirname(__file__), 'test_data')
+        cls.test_data_dir = TEST_DATA_DIR
         cls.data_loader = TestDataLoader(cls.test_data_dir)
         cls.environment = CampusEnvironment()
 
@@ -575,7 +588,7 @@ class MultiSystemTests(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         """Set up test environment"""
-        cls.test_data_dir = os.path.join(os.path.dirname(__file__), 'test_data')
+        cls.test_data_dir = TEST_DATA_DIR
         cls.data_loader = TestDataLoader(cls.test_data_dir)
         cls.environment = CampusEnvironment()
 
@@ -760,7 +773,7 @@ class CrossDaySimulationTests(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         """Set up test environment"""
-        cls.test_data_dir = os.path.join(os.path.dirname(__file__), 'test_data')
+        cls.test_data_dir = TEST_DATA_DIR
         cls.data_loader = TestDataLoader(cls.test_data_dir)
         cls.environment = CampusEnvironment()
 
@@ -907,7 +920,7 @@ class ActionFormatValidationTests(unittest.TestCase):
 
     def setUp(self):
         """Set up for each test"""
-        self.test_data_dir = os.path.join(os.path.dirname(__file__), 'test_data')
+        self.test_data_dir = TEST_DATA_DIR
         self.data_loader = TestDataLoader(self.test_data_dir)
 
     def test_valid_action_formats(self):
@@ -966,7 +979,7 @@ class UltraComplexIntegrationTests(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        cls.test_data_dir = os.path.join(os.path.dirname(__file__), 'test_data')
+        cls.test_data_dir = TEST_DATA_DIR
         cls.data_loader = TestDataLoader(cls.test_data_dir)
         cls.environment = CampusEnvironment()
 
@@ -1068,7 +1081,7 @@ class SystemAvailabilityValidationTests(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        cls.test_data_dir = os.path.join(os.path.dirname(__file__), 'test_data')
+        cls.test_data_dir = TEST_DATA_DIR
         cls.data_loader = TestDataLoader(cls.test_data_dir)
         cls.result_collector = TestResultCollector()
         cls.environment = CampusEnvironment()
@@ -1125,7 +1138,7 @@ class TemporalWeek1SimulationTests(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        cls.test_data_dir = os.path.join(os.path.dirname(__file__), 'test_data')
+        cls.test_data_dir = TEST_DATA_DIR
         cls.data_loader = TestDataLoader(cls.test_data_dir)
         cls.result_collector = TestResultCollector()
         cls.environment = CampusEnvironment()
@@ -1210,7 +1223,7 @@ class EndToEndIntegrationTests(unittest.TestCase):
 
 if __name__ == '__main__':
     # Create test data directory if it doesn't exist
-    test_data_dir = os.path.join(os.path.dirname(__file__), 'test_data')
+    test_data_dir = TEST_DATA_DIR
     os.makedirs(test_data_dir, exist_ok=True)
 
     # Run the test suite
@@ -0,0 +1,46 @@
+"""
+pytest configuration for the CampusLifeBench test suite
+src/ is put on the import path by tests/conftest.py
+
+For quick iteration run with the cache plugin disabled:
+    python -m pytest -q -p no:cacheprovider <test file>
+
+With pytest-xdist installed the unit tests (which build their own
+environments) can be spread over all cores:
+    python -m pytest -q -n auto tests/campus_life_bench/
+Fixture files (e.g. the map data in test_map_and_geography) are written
+to tempfile.mkdtemp() directories, which are unique per worker as well.
+
+Environment fixtures:
+    campus_env -- one CampusEnvironment per session (per xdist worker). Use it
+                  only when the test's changes cannot affect other tests, e.g.
+                  integration_tests/, which only sends independent emails and
+                  adds calendar events.
+
+Task fixtures:
+    chat_factory -- one ChatHistoryItemFactory over test_chat_history.json per
+                    session. Tasks only read it; the factory's set() is only
+                    called by the previous-sample callback, which tests do not use.
+"""
+
+from pathlib import Path
+
+import pytest
+
+CHAT_HISTORY_PATH = Path(__file__).parent / "test_chat_history.json"
+
+
+@pytest.fixture(scope="session")
+def campus_env():
+    """Campus environment shared by every test in the session"""
+    from tasks.instance.campus_life_bench.environment import CampusEnvironment
+
+    return CampusEnvironment()
+
+
+@pytest.fixture(scope="session")
+def chat_factory():
+    """Chat history factory shared by every task in the session"""
+    from factories.chat_history_item import ChatHistoryItemFactory
+
+    return ChatHistoryItemFactory(str(CHAT_HISTORY_PATH))
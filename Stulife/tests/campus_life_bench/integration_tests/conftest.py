@@ -0,0 +1,59 @@
+"""
+Shared pytest fixtures for the CampusLifeBench integration tests
+Expensive objects are built once per test session and reused by every module
+"""
+
+import json
+from functools import lru_cache
+from pathlib import Path
+
+import pytest
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# src/ itself is put on the import path by tests/conftest.py
+STULIFE_ROOT = Path(__file__).resolve().parents[3]
+SRC_PATH = STULIFE_ROOT / "src"
+
+# tasks.json is not shipped; test_tasks.json is the tracked sample dataset with the same layout
+TASKS_PATH = SRC_PATH / "tasks" / "instance" / "campus_life_bench" / "data" / "test_tasks.json"
+CONFIG_PATH = STULIFE_ROOT / "examples" / "campus_life_bench_system_configurations.json"
+
+
+def _load_json(path: Path):
+    """Parse a JSON file from its raw bytes (single read, no text decoding layer)"""
+    return _json_loads(path.read_bytes())
+
+
+@pytest.fixture(scope="session")
+def env(campus_env):
+    """Campus environment shared by all integration tests"""
+    return campus_env
+
+
+@pytest.fixture(scope="session")
+def get_executor(env):
+    """Factory returning one shared ActionExecutor per system combination"""
+    from tasks.instance.campus_life_bench.action_executor import ActionExecutor
+
+    @lru_cache(maxsize=None)
+    def _get_executor(systems):
+        return ActionExecutor(env, list(systems))
+
+    return lambda systems: _get_executor(tuple(sorted(systems)))
+
+
+@pytest.fixture(scope="session")
+def tasks_json():
+    """Parsed sample task dataset"""
+    return _load_json(TASKS_PATH)
+
+
+@pytest.fixture(scope="session")
+def config_json():
+    """Parsed system configuration examples"""
+    return _load_json(CONFIG_PATH)
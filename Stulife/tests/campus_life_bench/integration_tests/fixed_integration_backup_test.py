@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Fixed integration test for the new CampusLifeBench Action-based system
+"""
+
+import sys
+import re
+import ast
+from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType
+from typing import NamedTuple, Optional, Tuple
+
+import pytest
+
+from integration_output import buffered_output
+
+
+# Action parsing patterns, compiled once for every parse
+# _ACTION_RE is the reference definition of the Action: syntax; the parser
+# itself uses the equivalent _scan_action below
+# Actions are single-token names followed directly by '('; parameters run
+# to the first ')' so the match is linear with no lazy backtracking
+_ACTION_RE = re.compile(r'Action:\s*([^(\s]+)\(([^)]*)\)')
+_FINISH_RE = re.compile(r'\bfinish\s*\(\s*\)', re.IGNORECASE)
+_ACTION_PREFIX = 'Action:'
+_NO_ACTION = (-1, -1, -1, -1)
+
+
+def _scan_action(agent_response: str) -> Tuple[int, int, int, int]:
+    """
+    Locate the first Action: call with plain substring scans (no regex engine)
+    
+    Returns:
+        (name_start, name_end, params_start, params_end) offsets into
+        agent_response, or (-1, -1, -1, -1) when no action is found
+    """
+    prefix_pos = agent_response.find(_ACTION_PREFIX)
+    while prefix_pos != -1:
+        name_start = prefix_pos + len(_ACTION_PREFIX)
+        open_paren = agent_response.find('(', name_start)
+        if open_paren == -1:
+            break
+        close_paren = agent_response.find(')', open_paren + 1)
+        if close_paren == -1:
+            break
+        # The action name must be a single non-empty token right before '('
+        name_segment = agent_response[name_start:open_paren]
+        if name_segment.split() == [name_segment.lstrip()]:
+            return name_start, open_paren, open_paren + 1, close_paren
+        prefix_pos = agent_response.find(_ACTION_PREFIX, name_start)
+    return _NO_ACTION
+
+
+class AgentAction(Enum):
+    EXECUTE = "execute"
+    FINISH = "finish"
+    INVALID = "invalid"
+
+
+class AgentResponseParserResult(NamedTuple):
+    # Immutable so cached results can be shared between callers
+    action: AgentAction
+    content: Optional[str]
+    finish_reason: Optional[str]
+
+
+@lru_cache(maxsize=1024)
+def parse_agent_response(agent_response: str) -> AgentResponseParserResult:
+    """Parse agent response to extract action in new Action: format"""
+    # Look for Action: pattern first (new format)
+    name_start, name_end, params_start, params_end = _scan_action(agent_response)
+    
+    if name_start != -1:
+        action_name = agent_response[name_start:name_end].strip()
+        action_params = agent_response[params_start:params_end].strip()
+        
+        # Handle finish() action
+        if action_name.lower() == 'finish':
+            return AgentResponseParserResult(
+                action=AgentAction.FINISH,
+                content=None,
+                finish_reason=None
+            )
+        
+        # Handle tool actions
+        return AgentResponseParserResult(
+            action=AgentAction.EXECUTE,
+            content=f"{action_name}({action_params})",
+            finish_reason=None
+        )
+    
+    # Fallback: Look for finish keyword (backward compatibility)
+    if _FINISH_RE.search(agent_response):
+        return AgentResponseParserResult(
+            action=AgentAction.FINISH,
+            content=None,
+            finish_reason=None
+        )
+    
+    # No valid action found
+    return AgentResponseParserResult(
+        action=AgentAction.INVALID,
+        content=None,
+        finish_reason="No valid action found in response"
+    )
+
+def test_basic_functionality():
+    """Test basic functionality without complex imports"""
+    with buffered_output() as out:
+        out.append("🧪 Testing Basic Action Parsing:")
+        out.append("=" * 50)
+    
+        # Test cases
+        test_cases = [
+            ('Action: email.send_email(to="test@test.com", subject="Test")', AgentAction.EXECUTE),
+            ('Action: finish()', AgentAction.FINISH),
+            ('finish()', AgentAction.FINISH),
+            ('Invalid response', AgentAction.INVALID),
+            ('Action: map.find_building_id(building_name="Library")', AgentAction.EXECUTE),
+            ('Action:(x) then Action: calendar.view_schedule(date="Week 1")', AgentAction.EXECUTE),
+            ('Action: email.view_inbox(', AgentAction.INVALID),
+        ]
+    
+        passed = 0
+        for i, (test_input, expected) in enumerate(test_cases, 1):
+            result = parse_agent_response(test_input)
+            # The scanner must extract exactly what the reference regex matches
+            match = _ACTION_RE.search(test_input)
+            name_start, name_end, params_start, params_end = _scan_action(test_input)
+            if match:
+                scan_agrees = (
+                    test_input[name_start:name_end].strip() == match.group(1).strip()
+                    and test_input[params_start:params_end].strip() == match.group(2).strip()
+                )
+            else:
+                scan_agrees = name_start == -1
+            success = result.action == expected and scan_agrees
+            status = "✅ PASS" if success else "❌ FAIL"
+            out.append(f"{i}. {status} - {test_input[:50]}...")
+            if success:
+                passed += 1
+    
+        out.append(f"\n📊 Basic parsing: {passed}/{len(test_cases)} tests passed")
+        out.append(f"   Parse cache: {parse_agent_response.cache_info()}")
+        assert passed == len(test_cases)
+
+def test_json_configurations(tasks_json, config_json):
+    """Test JSON configuration loading"""
+    with buffered_output() as out:
+        out.append("\n📄 Testing JSON Configurations:")
+        out.append("=" * 50)
+    
+        # Test tasks.json
+        out.append(f"✅ Loaded the sample task dataset with {len(tasks_json)} tasks")
+    
+        # Check for available_systems field
+        tasks_with_systems = 0
+        for task_id, task_data in tasks_json.items():
+            if 'available_systems' in task_data:
+                tasks_with_systems += 1
+                out.append(f"   Task {task_id}: {task_data['available_systems']}")
+    
+        out.append(f"✅ Found {tasks_with_systems} tasks with available_systems field")
+        assert tasks_with_systems > 0
+    
+        # Test configuration examples
+        out.append(f"✅ Loaded configuration examples")
+        out.append(f"   Configurations: {len(config_json['configurations'])}")
+        out.append(f"   System combinations: {len(config_json['system_combinations'])}")
+
+def test_parameter_parsing():
+    """Test parameter parsing functionality"""
+    with buffered_output() as out:
+        out.append("\n🔧 Testing Parameter Parsing:")
+        out.append("=" * 50)
+    
+        def parse_parameters_simple(params_str: str) -> dict:
+            """Simple parameter parsing"""
+            # Parse as call arguments so quoted commas, escapes, negatives and
+            # scientific notation are handled by the Python tokenizer, as in
+            # ActionExecutor._parse_parameters
+            call_node = ast.parse(f"dummy_func({params_str})", mode='eval').body
+            return {keyword.arg: ast.literal_eval(keyword.value) for keyword in call_node.keywords}
+    
+        test_cases = [
+            ('to="test@test.com", subject="Test Subject"', {'to': 'test@test.com', 'subject': 'Test Subject'}),
+            ('filter_unread=True', {'filter_unread': True}),
+            ('count=5, active=False', {'count': 5, 'active': False}),
+            ('body="Hi, \\"Bob\\"", offset=-2, ratio=1e-3', {'body': 'Hi, "Bob"', 'offset': -2, 'ratio': 0.001}),
+        ]
+    
+        passed = 0
+        for i, (params_str, expected) in enumerate(test_cases, 1):
+            try:
+                result = parse_parameters_simple(params_str)
+                success = all(key in result and result[key] == expected[key] for key in expected)
+                status = "✅ PASS" if success else "❌ FAIL"
+                out.append(f"{i}. {status} - {params_str}")
+                out.append(f"   Expected: {expected}")
+                out.append(f"   Got: {result}")
+                if success:
+                    passed += 1
+            except Exception as e:
+                out.append(f"{i}. ❌ ERROR - {params_str}: {str(e)}")
+    
+        out.append(f"\n📊 Parameter parsing: {passed}/{len(test_cases)} tests passed")
+        assert passed == len(test_cases)
+
+# System mappings and availability scenarios, shared read-only by every run
+_SYSTEM_MAPPING = MappingProxyType({
+    "email": frozenset({"email.send_email", "email.view_inbox", "email.reply_email"}),
+    "calendar": frozenset({"calendar.add_event", "calendar.view_schedule"}),
+    "map": frozenset({"map.find_building_id", "map.find_optimal_path"}),
+    "geography": frozenset({"geography.get_current_location", "geography.walk_to"}),
+})
+
+# Reverse index: action -> owning system
+_ACTION_TO_SYSTEM = MappingProxyType({
+    action: system
+    for system, actions in _SYSTEM_MAPPING.items()
+    for action in actions
+})
+
+_SCENARIOS = (
+    (frozenset({"email"}), "email.send_email", True, "Email system available"),
+    (frozenset({"email"}), "map.find_building_id", False, "Map system not available"),
+    (frozenset({"email", "calendar"}), "calendar.add_event", True, "Calendar system available"),
+    (frozenset({"map", "geography"}), "geography.walk_to", True, "Geography system available"),
+)
+
+# One report block per scenario, rendered with a single format call
+_SCENARIO_TEMPLATE = (
+    "{status} - {description}\n"
+    "   Available systems: {systems}\n"
+    "   Action: {action}\n"
+    "   Allowed: {allowed} (expected: {expected})"
+)
+
+
+def test_system_availability_concept():
+    """Test system availability concept"""
+    with buffered_output() as out:
+        out.append("\n🔒 Testing System Availability Concept:")
+        out.append("=" * 50)
+    
+        passed = 0
+        for available_systems, action, should_be_allowed, description in _SCENARIOS:
+            is_allowed = _ACTION_TO_SYSTEM.get(action) in available_systems
+            success = is_allowed == should_be_allowed
+            status = "✅ PASS" if success else "❌ FAIL"
+        
+            out.append(_SCENARIO_TEMPLATE.format(
+                status=status,
+                description=description,
+                systems=sorted(available_systems),
+                action=action,
+                allowed=is_allowed,
+                expected=should_be_allowed,
+            ))
+        
+            if success:
+                passed += 1
+    
+        out.append(f"\n📊 System availability: {passed}/{len(_SCENARIOS)} tests passed")
+        assert passed == len(_SCENARIOS)
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -0,0 +1,22 @@
+"""
+Progress output shared by the CampusLifeBench integration test modules
+Per-test progress output is opt-in (CLB_VERBOSE=1); failures are reported by pytest
+"""
+
+import os
+import sys
+from contextlib import contextmanager
+from typing import Iterator, List
+
+VERBOSE = os.environ.get('CLB_VERBOSE') == '1'
+
+
+@contextmanager
+def buffered_output() -> Iterator[List[str]]:
+    """Collect a test's progress lines and write them with a single call"""
+    out: List[str] = []
+    try:
+        yield out
+    finally:
+        if VERBOSE and out:
+            sys.stdout.write("\n".join(out) + "\n")
@@ -8,21 +8,134 @@ and tests the complete pipeline from task loading to evaluation.
 
 import unittest
 import json
+import logging
 import sys
 import os
-import tempfile
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import TYPE_CHECKING, Dict, Any, List
 
-# Add the src directory to Python path
-current_dir = os.path.dirname(os.path.abspath(__file__))
-src_path = os.path.join(current_dir, '..', '..', 'src')
-sys.path.insert(0, src_path)
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
-from tasks.instance.campus_life_bench.task import CampusTask, CampusDatasetItem
-from tasks.instance.campus_life_bench.environment import CampusEnvironment
-from tasks.instance.campus_life_bench.action_executor import ActionExecutor
-from tasks.instance.campus_life_bench.system_prompt_generator import SystemPromptGenerator
+# The campus modules pull in the whole task framework, so they are imported on
+# first use rather than at collection time
+if TYPE_CHECKING:
+    from tasks.task import AgentResponseParserResult
+    from tasks.instance.campus_life_bench.task import CampusDatasetItem
+    from tasks.instance.campus_life_bench.environment import CampusEnvironment
+    from tasks.instance.campus_life_bench.action_executor import ActionExecutor
+    from tasks.instance.campus_life_bench.system_prompt_generator import SystemPromptGenerator
+
+logger = logging.getLogger(__name__)
+
+TEST_DATA_DIR = Path(__file__).parent / "test_data"
+
+
+@lru_cache(maxsize=None)
+def _load_test_tasks() -> Dict[str, Any]:
+    """Parse comprehensive_test_tasks.json once per process (tests only read it)"""
+    return _json_loads((TEST_DATA_DIR / "comprehensive_test_tasks.json").read_bytes())
+
+
+@lru_cache(maxsize=1)
+def _prompt_generator() -> "SystemPromptGenerator":
+    """One generator for the whole module so its prompt cache is shared by all tests"""
+    from tasks.instance.campus_life_bench.system_prompt_generator import SystemPromptGenerator
+    return SystemPromptGenerator()
+
+
+@lru_cache(maxsize=32)
+def _cached_executor(environment: "CampusEnvironment", systems: tuple) -> "ActionExecutor":
+    from tasks.instance.campus_life_bench.action_executor import ActionExecutor
+    return ActionExecutor(environment, list(systems))
+
+
+def _get_executor(environment: "CampusEnvironment", systems: List[str]) -> "ActionExecutor":
+    """Return a shared executor per environment and system set (executors hold no per-task state)"""
+    return _cached_executor(environment, tuple(sorted(systems)))
+
+
+@lru_cache(maxsize=None)
+def _parse_action(action: str) -> "AgentResponseParserResult":
+    """Parse an action string once; the tests only read the parsed results"""
+    from tasks.instance.campus_life_bench.task import CampusTask
+    return CampusTask._parse_agent_response(action)
+
+
+def _make_dataset_item(task_data: Dict[str, Any]) -> "CampusDatasetItem":
+    """Build a dataset item from a task description dict"""
+    from tasks.instance.campus_life_bench.task import CampusDatasetItem
+    return CampusDatasetItem(
+        task_id=task_data["task_id"],
+        task_type=task_data["task_type"],
+        instruction=task_data["instruction"],
+        available_systems=task_data["available_systems"]
+    )
+
+
+# Action sequence run by test_action_execution_pipeline
+PIPELINE_ACTIONS = [
+    'Action: email.send_email(to="test@university.edu", subject="Test", body="Hello")',
+    'Action: calendar.add_event(calendar_id="self", event_title="Meeting", location="Office", time="Week 1, Monday, 14:00-15:00")',
+    'Action: finish()'
+]
+
+# Failure cases checked by test_error_handling_and_recovery
+ERROR_SCENARIOS = [
+    {
+        "name": "Invalid action format",
+        "action": "invalid action format",
+        "expected_error": "INVALID"
+    },
+    {
+        "name": "Unavailable system",
+        "action": 'Action: map.find_building_id(building_name="Library")',
+        "expected_error": "not available"
+    },
+    {
+        "name": "Malformed parameters",
+        "action": 'Action: email.send_email(invalid_params)',
+        "expected_error": "parameter"
+    }
+]
+
+# System combinations checked by test_system_prompt_consistency
+SYSTEM_COMBOS = [
+    (["email"], "Email-only"),
+    (["email", "calendar"], "Email + Calendar"),
+    (["map", "geography"], "Navigation"),
+    (["email", "calendar", "map", "geography", "reservation"], "Multi-system"),
+    (None, "All systems")
+]
+
+# Single-action tasks executed by test_batch_task_processing
+BATCH_TASKS = [
+    {
+        "task_id": "batch_001",
+        "task_type": "email_sending",
+        "instruction": "Send an email to advisor",
+        "available_systems": ["email"],
+        "expected_action": 'Action: email.send_email(to="advisor@university.edu", subject="Question", body="I have a question")'
+    },
+    {
+        "task_id": "batch_002", 
+        "task_type": "navigation",
+        "instruction": "Find the library",
+        "available_systems": ["map"],
+        "expected_action": 'Action: map.find_building_id(building_name="Grand Central Library")'
+    },
+    {
+        "task_id": "batch_003",
+        "task_type": "calendar_management",
+        "instruction": "Add study session to calendar",
+        "available_systems": ["calendar"],
+        "expected_action": 'Action: calendar.add_event(calendar_id="self", event_title="Study", location="Library", time="Week 1, Tuesday, 14:00-16:00")'
+    }
+]
 
 
 class MockAgent:
@@ -44,26 +157,25 @@ class MockAgent:
 class LABIntegrationTests(unittest.TestCase):
     """Test integration with LAB framework"""
     
-    def setUp(self):
-        """Set up test environment"""
-        self.test_data_dir = Path(__file__).parent / "test_data"
-        self.temp_dir = tempfile.mkdtemp()
+    @classmethod
+    def setUpClass(cls):
+        """Set up the environment and test data once for the whole class
+
+        The tests only add independent emails and calendar events and never
+        modify the task data, so both are shared instead of rebuilt per test.
+        """
+        from tasks.instance.campus_life_bench.environment import CampusEnvironment
+        cls.environment = CampusEnvironment()
+        cls.test_data_dir = TEST_DATA_DIR
         
-        # Load test data
-        with open(self.test_data_dir / "comprehensive_test_tasks.json", 'r') as f:
-            self.test_tasks = json.load(f)
+        # Load test data (read-only, shared by all tests)
+        cls.test_tasks = _load_test_tasks()
     
     def test_task_loading_pipeline(self):
         """Test complete task loading and setup pipeline"""
         # Create test dataset items
         email_test = self.test_tasks["single_system_tests"]["email_system_test"]
-        
-        dataset_item = CampusDatasetItem(
-            task_id=email_test["task_id"],
-            task_type=email_test["task_type"],
-            instruction=email_test["instruction"],
-            available_systems=email_test["available_systems"]
-        )
+        dataset_item = _make_dataset_item(email_test)
         
         # Test dataset item creation
         self.assertEqual(dataset_item.task_id, "email_001")
@@ -71,37 +183,29 @@ class LABIntegrationTests(unittest.TestCase):
         self.assertEqual(dataset_item.get_available_systems(), ["email"])
         
         # Test system prompt generation
-        prompt_generator = SystemPromptGenerator()
-        system_prompt = prompt_generator.generate_prompt(dataset_item.available_systems)
+        system_prompt = _prompt_generator().generate_prompt(dataset_item.available_systems)
         
         # Validate prompt content
         self.assertIn("Email System Tools", system_prompt)
         self.assertNotIn("Map & Geography Tools", system_prompt)
         self.assertIn("send_email", system_prompt)
         
-        print(f"✅ Task loading pipeline validated")
-        print(f"   Dataset item: {dataset_item.task_id}")
-        print(f"   Available systems: {dataset_item.available_systems}")
-        print(f"   System prompt length: {len(system_prompt)} characters")
+        logger.debug("✅ Task loading pipeline validated")
+        logger.debug("   Dataset item: %s", dataset_item.task_id)
+        logger.debug("   Available systems: %s", dataset_item.available_systems)
+        logger.debug("   System prompt length: %d characters", len(system_prompt))
     
     def test_action_execution_pipeline(self):
         """Test complete action execution pipeline"""
         # Set up environment and executor
-        environment = CampusEnvironment()
-        executor = ActionExecutor(environment, ["email", "calendar"])
+        environment = self.environment
+        executor = _get_executor(environment, ["email", "calendar"])
         
-        # Test action sequence
-        actions = [
-            'Action: email.send_email(to="test@university.edu", subject="Test", body="Hello")',
-            'Action: calendar.add_event(calendar_id="self", event_title="Meeting", location="Office", time="Week 1, Monday, 14:00-15:00")',
-            'Action: finish()'
-        ]
+        # Parse the whole sequence up front
+        parsed_actions = list(map(_parse_action, PIPELINE_ACTIONS))
         
         results = []
-        for action in actions:
-            # Parse action
-            parsed = CampusTask._parse_agent_response(action)
-            
+        for action, parsed in zip(PIPELINE_ACTIONS, parsed_actions):
             if parsed.action.value == "finish":
                 results.append({
                     "action": action,
@@ -127,67 +231,38 @@ class LABIntegrationTests(unittest.TestCase):
                 })
         
         # Validate results
-        successful_actions = sum(1 for r in results if r["success"])
+        successful_actions = sum([r["success"] for r in results])
         total_actions = len(results)
         
         self.assertGreaterEqual(successful_actions, 2, f"Expected at least 2 successful actions, got {successful_actions}")
         
-        print(f"✅ Action execution pipeline validated")
-        print(f"   Actions executed: {total_actions}")
-        print(f"   Successful actions: {successful_actions}")
+        logger.debug("✅ Action execution pipeline validated")
+        logger.debug("   Actions executed: %d", total_actions)
+        logger.debug("   Successful actions: %d", successful_actions)
         for i, result in enumerate(results, 1):
             status_icon = "✅" if result["success"] else "❌"
-            print(f"   {i}. {status_icon} {result['status']}: {result['action'][:50]}...")
+            logger.debug("   %d. %s %s: %s...", i, status_icon, result['status'], result['action'][:50])
     
     def test_batch_task_processing(self):
         """Test processing multiple tasks in batch"""
-        # Create multiple test tasks
-        test_tasks = [
-            {
-                "task_id": "batch_001",
-                "task_type": "email_sending",
-                "instruction": "Send an email to advisor",
-                "available_systems": ["email"],
-                "expected_action": 'Action: email.send_email(to="advisor@university.edu", subject="Question", body="I have a question")'
-            },
-            {
-                "task_id": "batch_002", 
-                "task_type": "navigation",
-                "instruction": "Find the library",
-                "available_systems": ["map"],
-                "expected_action": 'Action: map.find_building_id(building_name="Grand Central Library")'
-            },
-            {
-                "task_id": "batch_003",
-                "task_type": "calendar_management",
-                "instruction": "Add study session to calendar",
-                "available_systems": ["calendar"],
-                "expected_action": 'Action: calendar.add_event(calendar_id="self", event_title="Study", location="Library", time="Week 1, Tuesday, 14:00-16:00")'
-            }
-        ]
-        
         batch_results = []
-        environment = CampusEnvironment()
+        environment = self.environment
+        prompt_generator = _prompt_generator()
         
-        for task_data in test_tasks:
-            # Create dataset item
-            dataset_item = CampusDatasetItem(
-                task_id=task_data["task_id"],
-                task_type=task_data["task_type"],
-                instruction=task_data["instruction"],
-                available_systems=task_data["available_systems"]
-            )
-            
-            # Create executor for this task
-            executor = ActionExecutor(environment, dataset_item.available_systems)
-            
-            # Generate system prompt
-            prompt_generator = SystemPromptGenerator()
-            system_prompt = prompt_generator.generate_prompt(dataset_item.available_systems)
-            
-            # Execute expected action
-            parsed = CampusTask._parse_agent_response(task_data["expected_action"])
-            if parsed.action.value == "execute":
+        for task_data in BATCH_TASKS:
+            with self.subTest(task_id=task_data["task_id"]):
+                # Create dataset item
+                dataset_item = _make_dataset_item(task_data)
+                
+                # Create executor for this task
+                executor = _get_executor(environment, dataset_item.available_systems)
+                
+                # Generate system prompt
+                system_prompt = prompt_generator.generate_prompt(dataset_item.available_systems)
+                
+                # Execute expected action
+                parsed = _parse_action(task_data["expected_action"])
+                self.assertEqual(parsed.action.value, "execute")
                 result = executor.execute_action(parsed.content)
                 
                 batch_results.append({
@@ -199,98 +274,56 @@ class LABIntegrationTests(unittest.TestCase):
                     "success": result.is_success(),
                     "message": result.message
                 })
+                
+                self.assertTrue(result.is_success(), f"{task_data['task_id']} failed: {result.message}")
         
-        # Validate batch processing
-        successful_tasks = sum(1 for r in batch_results if r["success"])
+        successful_tasks = sum([r["success"] for r in batch_results])
         total_tasks = len(batch_results)
         
-        self.assertEqual(successful_tasks, total_tasks, f"Expected all {total_tasks} tasks to succeed, got {successful_tasks}")
-        
-        print(f"✅ Batch task processing validated")
-        print(f"   Tasks processed: {total_tasks}")
-        print(f"   Successful tasks: {successful_tasks}")
+        logger.debug("✅ Batch task processing validated")
+        logger.debug("   Tasks processed: %d", total_tasks)
+        logger.debug("   Successful tasks: %d", successful_tasks)
         for result in batch_results:
             status_icon = "✅" if result["success"] else "❌"
-            print(f"   {status_icon} {result['task_id']}: {result['execution_status']}")
+            logger.debug("   %s %s: %s", status_icon, result['task_id'], result['execution_status'])
     
     def test_system_prompt_consistency(self):
         """Test that system prompts are consistent across different system combinations"""
-        test_combinations = [
-            (["email"], "Email-only"),
-            (["email", "calendar"], "Email + Calendar"),
-            (["map", "geography"], "Navigation"),
-            (["email", "calendar", "map", "geography", "reservation"], "Multi-system"),
-            (None, "All systems")
-        ]
-        
-        prompt_generator = SystemPromptGenerator()
         prompt_results = []
+        prompt_generator = _prompt_generator()
         
-        for systems, description in test_combinations:
-            prompt = prompt_generator.generate_prompt(systems)
-            
-            # Analyze prompt content
-            has_email = "Email System Tools" in prompt
-            has_calendar = "Calendar System Tools" in prompt
-            has_map = "Map & Geography Tools" in prompt
-            
-            prompt_results.append({
-                "description": description,
-                "systems": systems,
-                "prompt_length": len(prompt),
-                "has_email_tools": has_email,
-                "has_calendar_tools": has_calendar,
-                "has_map_tools": has_map,
-                "expected_email": systems is None or (systems and "email" in systems),
-                "expected_calendar": systems is None or (systems and "calendar" in systems),
-                "expected_map": systems is None or (systems and "map" in systems)
-            })
-        
-        # Validate consistency
-        all_consistent = True
-        for result in prompt_results:
-            email_consistent = result["has_email_tools"] == result["expected_email"]
-            calendar_consistent = result["has_calendar_tools"] == result["expected_calendar"]
-            map_consistent = result["has_map_tools"] == result["expected_map"]
-            
-            if not (email_consistent and calendar_consistent and map_consistent):
-                all_consistent = False
-                print(f"❌ Inconsistent prompt for {result['description']}")
-        
-        self.assertTrue(all_consistent, "System prompt generation is not consistent")
+        for systems, description in SYSTEM_COMBOS:
+            with self.subTest(description=description):
+                prompt = prompt_generator.generate_prompt(systems)
+                
+                # Analyze prompt content
+                result = {
+                    "description": description,
+                    "prompt_length": len(prompt),
+                    "has_email_tools": "Email System Tools" in prompt,
+                    "has_calendar_tools": "Calendar System Tools" in prompt,
+                    "has_map_tools": "Map & Geography Tools" in prompt
+                }
+                prompt_results.append(result)
+                
+                self.assertEqual(result["has_email_tools"], systems is None or "email" in systems)
+                self.assertEqual(result["has_calendar_tools"], systems is None or "calendar" in systems)
+                self.assertEqual(result["has_map_tools"], systems is None or "map" in systems)
         
-        print(f"✅ System prompt consistency validated")
+        logger.debug("✅ System prompt consistency validated")
         for result in prompt_results:
-            print(f"   {result['description']}: {result['prompt_length']} chars, Email: {result['has_email_tools']}, Calendar: {result['has_calendar_tools']}, Map: {result['has_map_tools']}")
+            logger.debug("   %s: %d chars, Email: %s, Calendar: %s, Map: %s", result['description'], result['prompt_length'],
+                         result['has_email_tools'], result['has_calendar_tools'], result['has_map_tools'])
     
     def test_error_handling_and_recovery(self):
         """Test error handling and recovery mechanisms"""
-        environment = CampusEnvironment()
-        executor = ActionExecutor(environment, ["email"])
-        
-        # Test various error scenarios
-        error_scenarios = [
-            {
-                "name": "Invalid action format",
-                "action": "invalid action format",
-                "expected_error": "INVALID"
-            },
-            {
-                "name": "Unavailable system",
-                "action": 'Action: map.find_building_id(building_name="Library")',
-                "expected_error": "not available"
-            },
-            {
-                "name": "Malformed parameters",
-                "action": 'Action: email.send_email(invalid_params)',
-                "expected_error": "parameter"
-            }
-        ]
+        environment = self.environment
+        executor = _get_executor(environment, ["email"])
         
         error_results = []
-        for scenario in error_scenarios:
+        for scenario in ERROR_SCENARIOS:
             try:
-                parsed = CampusTask._parse_agent_response(scenario["action"])
+                parsed = _parse_action(scenario["action"])
                 
                 if parsed.action.value == "invalid":
                     error_results.append({
@@ -318,15 +351,25 @@ class LABIntegrationTests(unittest.TestCase):
                 })
         
         # Validate error handling
-        all_handled = all(r["handled_correctly"] for r in error_results)
+        all_handled = all([r["handled_correctly"] for r in error_results])
         
         self.assertTrue(all_handled, f"Some errors were not handled correctly: {error_results}")
         
-        print(f"✅ Error handling and recovery validated")
+        logger.debug("✅ Error handling and recovery validated")
         for result in error_results:
             status_icon = "✅" if result["handled_correctly"] else "❌"
-            print(f"   {status_icon} {result['scenario']}: {result['error_type']}")
+            logger.debug("   %s %s: %s", status_icon, result['scenario'], result['error_type'])
 
 
 if __name__ == '__main__':
-    unittest.main(verbosity=2)
+    import pytest
+
+    # Test methods share no mutable state, so they can be spread over workers
+    # when pytest-xdist is installed; otherwise fall back to a serial run.
+    pytest_args = [__file__, "-v", "-p", "no:cacheprovider", "-p", "no:stepwise"]
+    try:
+        import xdist  # noqa: F401
+        pytest_args += ["-n", os.environ.get("CLB_WORKERS", "auto"), "--dist=load"]
+    except ImportError:
+        pass
+    sys.exit(pytest.main(pytest_args))
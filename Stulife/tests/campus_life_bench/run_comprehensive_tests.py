@@ -7,18 +7,37 @@ with performance metrics, system outputs, and validation results.
 """
 
 import unittest
+import contextlib
+import hashlib
+import inspect
+import io
 import json
 import sys
 import os
+import shutil
 import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field, replace
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+try:
+    import orjson
+
+    def _json_dumps(data) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _json_dumps(data) -> bytes:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
 
 # Add the src directory to Python path
 current_dir = os.path.dirname(os.path.abspath(__file__))
 src_path = os.path.join(current_dir, '..', '..', 'src')
 sys.path.insert(0, src_path)
 
+import comprehensive_action_test_suite
 from comprehensive_action_test_suite import (
     SingleSystemTests,
     MultiSystemTests,
@@ -31,13 +50,213 @@ from comprehensive_action_test_suite import (
 )
 
 
+# Everything a category's outcome depends on besides its own class source
+_CACHE_INPUTS = (
+    Path(src_path) / "tasks" / "instance" / "campus_life_bench",
+    # Task/AgentAction and the shared types and helpers the package imports
+    Path(src_path) / "tasks" / "task.py",
+    Path(src_path) / "typings",
+    Path(src_path) / "factories",
+    Path(src_path) / "utils",
+    Path(current_dir) / "comprehensive_action_test_suite.py",
+    # The data the suite actually runs on, including a CLB_TEST_DATA_DIR override
+    Path(comprehensive_action_test_suite.TEST_DATA_DIR),
+)
+
+
+def _source_digest() -> str:
+    """Hash the campus_life_bench package and its src/ dependencies, the test suite module and the test data"""
+    digest = hashlib.blake2b()
+    for root in _CACHE_INPUTS:
+        files = sorted(p for p in root.rglob("*") if p.is_file()) if root.is_dir() else [root]
+        for path in files:
+            if path.suffix == ".pyc" or not path.exists():
+                continue
+            digest.update(str(path.relative_to(root.parent)).encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _category_key(test_class, source_digest: str) -> str:
+    """Cache key for a category: its class source plus everything it depends on"""
+    return hashlib.blake2b(inspect.getsource(test_class).encode() + source_digest.encode()).hexdigest()
+
+
+def _write_json(path: Path, data: dict):
+    """Serialize in one call and write the document with a single buffered write
+
+    json.dump with indent issues one small write per token, which dominates
+    for reports that embed many tracebacks. orjson is used when installed.
+    """
+    payload = _json_dumps(data)
+    with open(path, 'wb', buffering=1024 * 1024) as f:
+        f.write(payload)
+
+
+@dataclass(slots=True)
+class CategoryResult:
+    """Outcome of one test category, converted to a dict only when written out"""
+    tests_run: int
+    failures: int
+    errors: int
+    success_rate: float
+    execution_time_seconds: float
+    status: str
+    failure_details: List[Dict[str, Any]] = field(default_factory=list)
+    error_details: List[Dict[str, Any]] = field(default_factory=list)
+    # Dependencies that did not pass, for SKIPPED categories
+    skipped_because: Optional[List[str]] = None
+    # Reused from the pass cache instead of being run
+    cached: bool = False
+
+
+# Shared by every category run in this process
+_loader = unittest.TestLoader()
+
+
+@lru_cache(maxsize=None)
+def _test_names(test_class) -> tuple:
+    """Test method names of a category class, introspected once per process"""
+    names = tuple(_loader.getTestCaseNames(test_class))
+    if not names and hasattr(test_class, 'runTest'):
+        names = ('runTest',)
+    return names
+
+
+def _load_suite(test_class) -> unittest.TestSuite:
+    """Fresh suite for a category class (a suite empties itself while it runs)"""
+    return _loader.suiteClass(map(test_class, _test_names(test_class)))
+
+
+def _run_category(test_class, runner: unittest.TextTestRunner, stream) -> tuple:
+    """Run one test category and return its result record and any output to show
+
+    When the runner writes to an in-memory stream, the captured output is only
+    returned for a failing category and the stream is cleared for the next one.
+    """
+    category_start = time.time()
+    
+    # Create test suite for this category
+    suite = _load_suite(test_class)
+    result = runner.run(suite)
+    
+    category_time = time.time() - category_start
+    
+    output = ""
+    if isinstance(stream, io.StringIO):
+        if not result.wasSuccessful():
+            output = stream.getvalue()
+        stream.seek(0)
+        stream.truncate()
+    
+    record = CategoryResult(
+        tests_run=result.testsRun,
+        failures=len(result.failures),
+        errors=len(result.errors),
+        success_rate=(result.testsRun - len(result.failures) - len(result.errors)) / result.testsRun if result.testsRun > 0 else 0,
+        execution_time_seconds=category_time,
+        status="PASS" if len(result.failures) == 0 and len(result.errors) == 0 else "FAIL",
+        # Passing categories (the common case) skip formatting the test names
+        failure_details=[{"test": str(test), "error": error} for test, error in result.failures] if result.failures else [],
+        error_details=[{"test": str(test), "error": error} for test, error in result.errors] if result.errors else []
+    )
+    return record, output
+
+
+def _intern_tracebacks(category_results: dict) -> tuple:
+    """Replace each failure/error traceback with an index into a list of unique tracebacks
+
+    Tests that fail the same way (e.g. a missing data file hit in setUpClass)
+    produce identical tracebacks, which the report then stores only once.
+    Returns the category records as dicts and the traceback list.
+    """
+    tracebacks, tb_index = [], {}
+    
+    def ref(error: str) -> int:
+        if error not in tb_index:
+            tb_index[error] = len(tracebacks)
+            tracebacks.append(error)
+        return tb_index[error]
+    
+    interned = {
+        name: dict(
+            asdict(record),
+            failure_details=[{"test": d["test"], "error_ref": ref(d["error"])} for d in record.failure_details],
+            error_details=[{"test": d["test"], "error_ref": ref(d["error"])} for d in record.error_details]
+        )
+        for name, record in category_results.items()
+    }
+    return interned, tracebacks
+
+
+def _skipped_record(failed_dependencies: list) -> CategoryResult:
+    """Result record for a category not run because a category it depends on did not pass"""
+    return CategoryResult(
+        tests_run=0,
+        failures=0,
+        errors=0,
+        success_rate=0,
+        execution_time_seconds=0,
+        status="SKIPPED",
+        skipped_because=failed_dependencies
+    )
+
+
+# Runner and stream of the current worker process, created on first use
+_worker_runner = None
+
+
+def _run_category_in_worker(class_name: str) -> tuple:
+    """Worker entry point: run the category class named class_name"""
+    global _worker_runner
+    if _worker_runner is None:
+        stream = io.StringIO()
+        _worker_runner = (unittest.TextTestRunner(verbosity=2, stream=stream, buffer=True), stream)
+    runner, stream = _worker_runner
+    return _run_category(getattr(comprehensive_action_test_suite, class_name), runner, stream)
+
+
+# (name, test class, categories it depends on); dependencies are listed earlier
+TEST_CATEGORIES: Tuple[Tuple[str, Type[unittest.TestCase], Tuple[str, ...]], ...] = (
+    ("Single System Tests", SingleSystemTests, ()),
+    ("Multi-System Tests", MultiSystemTests, ("Single System Tests",)),
+    ("Ultra-Complex Integration", UltraComplexIntegrationTests, ("Single System Tests", "Multi-System Tests")),
+    ("System Availability Validation", SystemAvailabilityValidationTests, ()),
+    ("Temporal Week 1 Simulation", TemporalWeek1SimulationTests, ("Single System Tests",)),
+    ("Action Format Validation", ActionFormatValidationTests, ()),
+    ("End-to-End Integration", EndToEndIntegrationTests, ("Single System Tests", "Multi-System Tests"))
+)
+
+# system_validation flag -> category whose passing establishes it
+SYSTEM_VALIDATION: Dict[str, str] = {
+    "action_parsing_validated": "Action Format Validation",
+    "single_systems_validated": "Single System Tests",
+    "multi_system_integration_validated": "Multi-System Tests",
+    "system_availability_enforced": "System Availability Validation",
+    "temporal_consistency_validated": "Temporal Week 1 Simulation",
+    "end_to_end_integration_validated": "End-to-End Integration",
+    "ultra_complex_scenarios_validated": "Ultra-Complex Integration"
+}
+
+
 class ComprehensiveTestRunner:
     """Runs all test categories and generates comprehensive reports"""
     
-    def __init__(self, output_dir: str = None):
+    def __init__(self, output_dir: str = None, verbose: bool = False, serial: bool = False, force: bool = False,
+                 fail_fast: bool = False):
         self.output_dir = Path(output_dir) if output_dir else Path(current_dir) / "test_results"
+        self.verbose = verbose
+        # Live verbose output only makes sense from a single process
+        self.serial = serial or verbose
+        # Skip categories whose dependencies did not pass
+        self.fail_fast = fail_fast
         self.output_dir.mkdir(exist_ok=True)
-        self.start_time = time.time()
+        # Categories that passed with unchanged sources are not re-run unless forced
+        self._cache_file = self.output_dir / ".test_cache.json"
+        self._cache = {} if force else self._load_cache()
+        # Read the clock once; the run's timestamps all derive from these two values
+        self.start_datetime = datetime.now()
+        self.start_time = self.start_datetime.timestamp()
         self.results = {}
         
     def run_all_tests(self):
@@ -45,25 +264,16 @@ class ComprehensiveTestRunner:
         print("🚀 Starting Comprehensive CampusLifeBench Action System Tests")
         print("=" * 80)
         
-        test_categories = [
-            ("Single System Tests", SingleSystemTests),
-            ("Multi-System Tests", MultiSystemTests),
-            ("Ultra-Complex Integration", UltraComplexIntegrationTests),
-            ("System Availability Validation", SystemAvailabilityValidationTests),
-            ("Temporal Week 1 Simulation", TemporalWeek1SimulationTests),
-            ("Action Format Validation", ActionFormatValidationTests),
-            ("End-to-End Integration", EndToEndIntegrationTests)
-        ]
-        
         overall_results = {
             "test_suite_metadata": {
                 "name": "CampusLifeBench Action System Comprehensive Test Suite",
                 "version": "1.0",
-                "timestamp": datetime.now().isoformat(),
-                "total_categories": len(test_categories),
-                "execution_start_time": datetime.fromtimestamp(self.start_time).isoformat()
+                "timestamp": self.start_datetime.isoformat(),
+                "total_categories": len(TEST_CATEGORIES),
+                "execution_start_time": self.start_datetime.isoformat()
             },
             "test_categories": {},
+            "tracebacks": [],
             "summary": {},
             "performance_metrics": {},
             "system_validation": {}
@@ -71,42 +281,66 @@ class ComprehensiveTestRunner:
         
         category_results = {}
         
-        for category_name, test_class in test_categories:
-            print(f"\n🧪 Running {category_name}")
-            print("-" * 60)
-            
-            category_start = time.time()
-            
-            # Create test suite for this category
-            suite = unittest.TestLoader().loadTestsFromTestCase(test_class)
-            
-            # Run tests with custom result collector
-            runner = unittest.TextTestRunner(verbosity=2, stream=sys.stdout)
-            result = runner.run(suite)
-            
-            category_time = time.time() - category_start
-            
-            # Collect category results
-            category_results[category_name] = {
-                "tests_run": result.testsRun,
-                "failures": len(result.failures),
-                "errors": len(result.errors),
-                "success_rate": (result.testsRun - len(result.failures) - len(result.errors)) / result.testsRun if result.testsRun > 0 else 0,
-                "execution_time_seconds": category_time,
-                "status": "PASS" if len(result.failures) == 0 and len(result.errors) == 0 else "FAIL",
-                "failure_details": [{"test": str(test), "error": error} for test, error in result.failures],
-                "error_details": [{"test": str(test), "error": error} for test, error in result.errors]
-            }
-            
-            print(f"   ✅ {category_name}: {result.testsRun} tests, {len(result.failures)} failures, {len(result.errors)} errors")
-        
-        # Calculate overall metrics
-        total_tests = sum(cat["tests_run"] for cat in category_results.values())
-        total_failures = sum(cat["failures"] for cat in category_results.values())
-        total_errors = sum(cat["errors"] for cat in category_results.values())
-        total_time = time.time() - self.start_time
-        
-        overall_results["test_categories"] = category_results
+        # Reuse passing results whose sources have not changed since they were recorded
+        source_digest = _source_digest()
+        category_keys = {name: _category_key(test_class, source_digest) for name, test_class, _ in TEST_CATEGORIES}
+        cached_results = {}
+        for category_name, _, _ in TEST_CATEGORIES:
+            entry = self._cache.get(category_name)
+            if entry and entry["key"] == category_keys[category_name]:
+                try:
+                    cached_results[category_name] = replace(CategoryResult(**entry["record"]), execution_time_seconds=0, cached=True)
+                except TypeError:
+                    # Recorded in an older format; just run the category again
+                    pass
+        if self.fail_fast:
+            # Cached passes are only reused once their dependencies have passed in this run
+            pending = list(TEST_CATEGORIES)
+        else:
+            pending = [category for category in TEST_CATEGORIES if category[0] not in cached_results]
+        
+        # One runner for all categories when serial. Unless verbose, its output (and the
+        # tests' own stdout/stderr) is buffered and only shown for categories that fail.
+        stream = sys.stdout if self.verbose else io.StringIO()
+        runner = unittest.TextTestRunner(verbosity=2, stream=stream, buffer=not self.verbose) if self.serial else None
+        # Otherwise categories share no state, so each runs in its own process
+        max_workers = max(1, min(len(pending), os.cpu_count() or 1))
+        with contextlib.nullcontext() if self.serial else ProcessPoolExecutor(max_workers=max_workers) as executor:
+            while pending:
+                if self.fail_fast:
+                    # Run in dependency order, one batch of ready categories at a time
+                    batch, pending = self._schedule(pending, category_results, cached_results)
+                else:
+                    batch, pending = pending, []
+                self._run_batch(batch, category_results, runner, stream, executor)
+        
+        # Keep the report in category order
+        category_results = {name: category_results.get(name) or cached_results[name] for name, _, _ in TEST_CATEGORIES}
+        for category_name, record in category_results.items():
+            if record.cached:
+                print(f"\n♻️  {category_name}: {record.tests_run} tests, cached PASS (sources unchanged)")
+        self._update_cache(category_results, category_keys)
+        
+        # Calculate overall metrics and the fastest/slowest category in one pass
+        total_tests = total_failures = total_errors = 0
+        fastest = slowest = None
+        for category_name, cat in category_results.items():
+            total_tests += cat.tests_run
+            total_failures += cat.failures
+            total_errors += cat.errors
+            # Cached and skipped categories did not run, so their 0 s says nothing about speed
+            if cat.cached or cat.status == "SKIPPED":
+                continue
+            category_time = cat.execution_time_seconds
+            if fastest is None or category_time < fastest[1]:
+                fastest = (category_name, category_time)
+            if slowest is None or category_time > slowest[1]:
+                slowest = (category_name, category_time)
+        end_now = datetime.now()
+        total_time = end_now.timestamp() - self.start_time
+        
+        # Details reference the shared traceback list by "error_ref"
+        overall_results["test_categories"], overall_results["tracebacks"] = _intern_tracebacks(category_results)
         overall_results["summary"] = {
             "total_tests": total_tests,
             "total_failures": total_failures,
@@ -119,33 +353,103 @@ class ComprehensiveTestRunner:
         overall_results["performance_metrics"] = {
             "average_test_time_seconds": total_time / total_tests if total_tests > 0 else 0,
             "tests_per_second": total_tests / total_time if total_time > 0 else 0,
-            "fastest_category": min(category_results.items(), key=lambda x: x[1]["execution_time_seconds"])[0] if category_results else None,
-            "slowest_category": max(category_results.items(), key=lambda x: x[1]["execution_time_seconds"])[0] if category_results else None
+            "fastest_category": fastest[0] if fastest else None,
+            "slowest_category": slowest[0] if slowest else None
         }
         
         # System validation summary
         overall_results["system_validation"] = {
-            "action_parsing_validated": "Action Format Validation" in category_results and category_results["Action Format Validation"]["status"] == "PASS",
-            "single_systems_validated": "Single System Tests" in category_results and category_results["Single System Tests"]["status"] == "PASS",
-            "multi_system_integration_validated": "Multi-System Tests" in category_results and category_results["Multi-System Tests"]["status"] == "PASS",
-            "system_availability_enforced": "System Availability Validation" in category_results and category_results["System Availability Validation"]["status"] == "PASS",
-            "temporal_consistency_validated": "Temporal Week 1 Simulation" in category_results and category_results["Temporal Week 1 Simulation"]["status"] == "PASS",
-            "end_to_end_integration_validated": "End-to-End Integration" in category_results and category_results["End-to-End Integration"]["status"] == "PASS",
-            "ultra_complex_scenarios_validated": "Ultra-Complex Integration" in category_results and category_results["Ultra-Complex Integration"]["status"] == "PASS"
+            flag: getattr(category_results.get(category_name), "status", None) == "PASS"
+            for flag, category_name in SYSTEM_VALIDATION.items()
         }
         
         # Save results
-        self._save_results(overall_results)
+        self._save_results(overall_results, end_now)
         self._print_summary(overall_results)
         
         return overall_results
     
-    def _save_results(self, results: dict):
-        """Save test results to JSON files"""
+    def _schedule(self, pending: list, category_results: dict, cached_results: dict) -> tuple:
+        """Pick the pending categories whose dependencies have all passed
+
+        Categories depending on one that did not pass get a SKIPPED record in
+        category_results, whether or not they have a cached pass. Ready categories
+        with a cached pass take the cached record instead of running. Returns the
+        batch to run now and the categories left waiting.
+        """
+        batch, waiting = [], []
+        settled_before = len(category_results)
+        for category in pending:
+            category_name, _, depends_on = category
+            failed = [dep for dep in depends_on if dep in category_results and category_results[dep].status != "PASS"]
+            if failed:
+                category_results[category_name] = _skipped_record(failed)
+                print(f"\n⏭️  {category_name}: skipped, depends on {', '.join(failed)}")
+            elif not all(dep in category_results for dep in depends_on):
+                waiting.append(category)
+            elif category_name in cached_results:
+                category_results[category_name] = cached_results[category_name]
+            else:
+                batch.append(category)
+        if waiting and not batch and len(category_results) == settled_before:
+            raise ValueError(f"Unresolvable dependencies for categories: {[name for name, _, _ in waiting]}")
+        return batch, waiting
+    
+    def _run_batch(self, batch: list, category_results: dict, runner, stream, executor):
+        """Run a batch of categories in this process or on the executor, in batch order"""
+        if executor is None:
+            for category_name, test_class, _ in batch:
+                self._print_category_header(category_name)
+                category_results[category_name], output = _run_category(test_class, runner, stream)
+                self._print_category_result(category_name, category_results[category_name], output)
+        else:
+            outcomes = executor.map(_run_category_in_worker, [test_class.__name__ for _, test_class, _ in batch])
+            for (category_name, _, _), (record, output) in zip(batch, outcomes):
+                self._print_category_header(category_name)
+                category_results[category_name] = record
+                self._print_category_result(category_name, record, output)
+    
+    def _load_cache(self) -> dict:
+        """Load the per-category pass cache, ignoring a missing or unreadable file"""
+        try:
+            return json.loads(self._cache_file.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+    
+    def _update_cache(self, category_results: dict, category_keys: dict):
+        """Remember passing categories; failing ones are dropped so they always re-run"""
+        cache = {
+            name: {"key": category_keys[name], "record": asdict(replace(record, cached=False))}
+            for name, record in category_results.items()
+            if record.status == "PASS"
+        }
+        _write_json(self._cache_file, cache)
+    
+    def _print_category_header(self, category_name: str):
+        """Print the banner for a test category"""
+        print(f"\n🧪 Running {category_name}")
+        print("-" * 60)
+    
+    def _print_category_result(self, category_name: str, record: CategoryResult, output: str):
+        """Print a category's captured output (failures only) and its result line"""
+        if output:
+            sys.stdout.write(output)
+        print(f"   ✅ {category_name}: {record.tests_run} tests, {record.failures} failures, {record.errors} errors")
+    
+    def _save_results(self, results: dict, end_now: datetime):
+        """Save test results to JSON files, naming the main file after the run's end time"""
         # Main results file
-        main_results_file = self.output_dir / f"comprehensive_test_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(main_results_file, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        main_results_file = self.output_dir / f"comprehensive_test_results_{end_now.strftime('%Y%m%d_%H%M%S')}.json"
+        _write_json(main_results_file, results)
+        
+        # Stable name for the newest full report without writing it a second time
+        latest_file = self.output_dir / "latest_full.json"
+        latest_file.unlink(missing_ok=True)
+        try:
+            latest_file.symlink_to(main_results_file.name)
+        except OSError:
+            # Symlinks may be unavailable (e.g. Windows without the privilege)
+            shutil.copyfile(main_results_file, latest_file)
         
         # Summary file
         summary_file = self.output_dir / "latest_test_summary.json"
@@ -157,11 +461,11 @@ class ComprehensiveTestRunner:
             "execution_time": results["summary"]["total_execution_time_seconds"],
             "system_validation": results["system_validation"]
         }
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, indent=2, ensure_ascii=False)
+        _write_json(summary_file, summary)
         
         print(f"\n📄 Results saved to: {main_results_file}")
         print(f"📄 Summary saved to: {summary_file}")
+        print(f"📄 Latest full results: {latest_file}")
     
     def _print_summary(self, results: dict):
         """Print test summary"""
@@ -186,7 +490,7 @@ class ComprehensiveTestRunner:
         
         print(f"\n📋 Category Results:")
         for category_name, category_result in results["test_categories"].items():
-            status_icon = "✅" if category_result["status"] == "PASS" else "❌"
+            status_icon = {"PASS": "✅", "SKIPPED": "⏭️ "}.get(category_result["status"], "❌")
             print(f"   {status_icon} {category_name}: {category_result['tests_run']} tests, {category_result['success_rate']:.1%} success")
         
         if summary['overall_status'] == 'PASS':
@@ -202,7 +506,10 @@ def main():
     
     parser = argparse.ArgumentParser(description="Run comprehensive CampusLifeBench Action system tests")
     parser.add_argument("--output-dir", help="Output directory for test results", default=None)
-    parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output (implies --serial)")
+    parser.add_argument("--serial", action="store_true", help="Run test categories one after another in this process")
+    parser.add_argument("--force", action="store_true", help="Re-run categories that passed with unchanged sources")
+    parser.add_argument("--fail-fast", action="store_true", help="Skip categories whose dependencies did not pass")
     
     args = parser.parse_args()
     
@@ -210,7 +517,8 @@ def main():
     output_dir = args.output_dir or os.path.join(os.path.dirname(__file__), "test_results")
     
     # Run tests
-    runner = ComprehensiveTestRunner(output_dir)
+    runner = ComprehensiveTestRunner(output_dir, verbose=args.verbose, serial=args.serial, force=args.force,
+                                     fail_fast=args.fail_fast)
     results = runner.run_all_tests()
     
     # Exit with appropriate code
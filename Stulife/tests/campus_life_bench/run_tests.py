@@ -6,7 +6,11 @@ All natural language communications/returns MUST use English only
 """
 
 import unittest
+import importlib
+import json
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 import argparse
 
@@ -14,6 +18,97 @@ import argparse
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 
 
+# Discovered test ids, reused while no test_*.py file is added, removed or modified
+DISCOVERY_CACHE = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "campuslifebench" / "discovery.json"
+
+
+# Shared by the unit test run and single-module runs
+_loader = unittest.TestLoader()
+
+
+def _iter_tests(suite):
+    """Yield the individual test cases of a (nested) suite"""
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            yield from _iter_tests(test)
+        else:
+            yield test
+
+
+def _discover_tests(loader, start_dir):
+    """Discover test_*.py tests, loading them by cached id when the files are unchanged"""
+    test_files = sorted(start_dir.glob('test_*.py'))
+    signature = [str(start_dir), [p.name for p in test_files], max((p.stat().st_mtime_ns for p in test_files), default=0)]
+    
+    try:
+        cached = json.loads(DISCOVERY_CACHE.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        cached = None
+    
+    if cached and cached.get("signature") == signature:
+        # discover() would put start_dir on the path; do the same for the named load
+        if str(start_dir) not in sys.path:
+            sys.path.insert(0, str(start_dir))
+        # Modules are loaded in discovery order since importing one can affect the next
+        suite = unittest.TestSuite()
+        for module_name, test_ids in cached["modules"]:
+            if test_ids is None:
+                # Failed to import last time; rediscover so the error is still reported
+                suite.addTests(loader.discover(start_dir, pattern=f'{module_name}.py'))
+            else:
+                suite.addTests(loader.loadTestsFromNames(test_ids))
+        return suite
+    
+    suite = loader.discover(start_dir, pattern='test_*.py')
+    modules = {}
+    for test in _iter_tests(suite):
+        # Import failures are placeholder tests that cannot be loaded by name
+        if isinstance(test, unittest.loader._FailedTest):
+            modules[test._testMethodName] = None
+        else:
+            modules.setdefault(type(test).__module__, []).append(test.id())
+    try:
+        DISCOVERY_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        DISCOVERY_CACHE.write_text(json.dumps({
+            "signature": signature,
+            "modules": list(modules.items())
+        }), encoding='utf-8')
+    except OSError:
+        pass
+    return suite
+
+
+# Components checked by validate_requirements: (label, module, names it must provide)
+REQUIRED_IMPORTS = (
+    ("All subsystems", "tasks.instance.campus_life_bench.systems", (
+        "WorldTimeSystem", "CalendarSystem", "MapLookupSystem", "GeographySystem",
+        "ReservationSystem", "InformationSystem", "CourseSelectionSystem", "EmailSystem"
+    )),
+    ("CampusTask", "tasks.instance.campus_life_bench.task", ("CampusTask",)),
+    ("CampusEnvironment", "tasks.instance.campus_life_bench.environment", ("CampusEnvironment",)),
+)
+
+# Names imported by _import_requirements, shared by the validation and smoke test
+_imported = {}
+
+
+@lru_cache(maxsize=1)
+def _import_requirements():
+    """Import every required component once, returning {label: ImportError or None}"""
+    errors = {}
+    for label, module_name, names in REQUIRED_IMPORTS:
+        try:
+            module = importlib.import_module(module_name)
+            missing = [name for name in names if not hasattr(module, name)]
+            if missing:
+                raise ImportError(f"cannot import name {', '.join(missing)} from '{module_name}'")
+            _imported.update((name, getattr(module, name)) for name in names)
+            errors[label] = None
+        except ImportError as e:
+            errors[label] = e
+    return errors
+
+
 def run_unit_tests():
     """Run all unit tests"""
     print("=" * 60)
@@ -21,9 +116,8 @@ def run_unit_tests():
     print("=" * 60)
     
     # Discover and run unit tests
-    loader = unittest.TestLoader()
-    start_dir = Path(__file__).parent
-    suite = loader.discover(start_dir, pattern='test_*.py')
+    start_dir = Path(__file__).resolve().parent
+    suite = _discover_tests(_loader, start_dir)
     
     runner = unittest.TextTestRunner(verbosity=2)
     result = runner.run(suite)
@@ -35,8 +129,7 @@ def run_specific_test(test_name):
     """Run a specific test module"""
     print(f"Running specific test: {test_name}")
     
-    loader = unittest.TestLoader()
-    suite = loader.loadTestsFromName(test_name)
+    suite = _loader.loadTestsFromName(test_name)
     
     runner = unittest.TextTestRunner(verbosity=2)
     result = runner.run(suite)
@@ -67,40 +160,30 @@ def validate_requirements():
     
     base_path = Path(__file__).parent.parent.parent
     
+    # List each directory holding required files once instead of stat()ing every file
+    present = set()
+    for directory in {(base_path / file_path).parent for file_path in required_files}:
+        try:
+            with os.scandir(directory) as entries:
+                present.update(Path(entry.path) for entry in entries if entry.is_file())
+        except OSError:
+            pass
+    
     for file_path in required_files:
         full_path = base_path / file_path
-        if not full_path.exists():
+        if full_path not in present:
             print(f"❌ MISSING: {file_path}")
             requirements_met = False
         else:
             print(f"✅ FOUND: {file_path}")
     
-    # Check that all subsystems are implemented
-    try:
-        from tasks.instance.campus_life_bench.systems import (
-            WorldTimeSystem, CalendarSystem, MapLookupSystem, GeographySystem,
-            ReservationSystem, InformationSystem, CourseSelectionSystem, EmailSystem
-        )
-        print("✅ All subsystems imported successfully")
-    except ImportError as e:
-        print(f"❌ IMPORT ERROR: {e}")
-        requirements_met = False
-    
-    # Check that CampusTask can be imported
-    try:
-        from tasks.instance.campus_life_bench.task import CampusTask
-        print("✅ CampusTask imported successfully")
-    except ImportError as e:
-        print(f"❌ IMPORT ERROR: {e}")
-        requirements_met = False
-    
-    # Check that CampusEnvironment can be imported
-    try:
-        from tasks.instance.campus_life_bench.environment import CampusEnvironment
-        print("✅ CampusEnvironment imported successfully")
-    except ImportError as e:
-        print(f"❌ IMPORT ERROR: {e}")
-        requirements_met = False
+    # Check that all subsystems, CampusTask and CampusEnvironment can be imported
+    for label, error in _import_requirements().items():
+        if error is None:
+            print(f"✅ {label} imported successfully")
+        else:
+            print(f"❌ IMPORT ERROR: {error}")
+            requirements_met = False
     
     return requirements_met
 
@@ -112,9 +195,11 @@ def run_smoke_test():
     print("=" * 60)
     
     try:
-        # Import and create basic instances
-        from tasks.instance.campus_life_bench.task import CampusTask
-        from tasks.instance.campus_life_bench.environment import CampusEnvironment
+        # Import and create basic instances (reusing the validation imports under --all)
+        error = _import_requirements()["CampusTask"]
+        if error is not None:
+            raise error
+        CampusTask = _imported["CampusTask"]
         from factories.chat_history_item import ChatHistoryItemFactory
         
         # Create instances
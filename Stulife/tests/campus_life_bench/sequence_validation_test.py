@@ -6,6 +6,7 @@ Tests the new sequence validation functionality in CampusTask
 
 import sys
 import os
+from functools import lru_cache
 from pathlib import Path
 
 # Add the src directory to the path
@@ -13,31 +14,37 @@ current_dir = Path(__file__).parent
 src_dir = current_dir.parent.parent / "src"
 sys.path.insert(0, str(src_dir))
 
+
+class MockChatHistoryItemFactory:
+    """Minimal factory (not needed for sequence validation or action recording tests)"""
+    def __init__(self):
+        pass
+
+
+@lru_cache(maxsize=1)
+def _get_task():
+    """Build the CampusTask once; loading its data files dominates the test cost"""
+    from tasks.instance.campus_life_bench.task import CampusTask
+    from typings import TaskName
+
+    test_data_dir = src_dir / "tasks" / "instance" / "campus_life_bench" / "data"
+    return CampusTask(
+        task_name=TaskName.CAMPUS_LIFE_BENCH,
+        chat_history_item_factory=MockChatHistoryItemFactory(),
+        max_round=10,
+        data_dir=test_data_dir
+    )
+
+
 def test_sequence_validation_logic():
     """Test the sequence validation logic directly"""
     print("\n🧪 Testing Sequence Validation Logic")
     print("=" * 50)
     
     try:
-        from tasks.instance.campus_life_bench.task import CampusTask, CampusDatasetItem
-        from factories.chat_history_item import ChatHistoryItemFactory
-        from typings import TaskName
-        
-        # Create a test task instance with minimal factory
-        from pathlib import Path
-        test_data_dir = Path(__file__).parent.parent.parent / "src" / "tasks" / "instance" / "campus_life_bench" / "data"
-
-        # Create a minimal factory (we don't need it for sequence validation tests)
-        class MockChatHistoryItemFactory:
-            def __init__(self):
-                pass
-
-        task = CampusTask(
-            task_name=TaskName.CAMPUS_LIFE_BENCH,
-            chat_history_item_factory=MockChatHistoryItemFactory(),
-            max_round=10,
-            data_dir=test_data_dir
-        )
+        # Shared task instance; only its action history is per-test state
+        task = _get_task()
+        task.action_history = []
         
         # Test 1: Correct sequence validation
         print("\n📋 Test 1: Correct Sequence Validation")
@@ -120,26 +127,11 @@ def test_action_recording():
     print("=" * 50)
     
     try:
-        from tasks.instance.campus_life_bench.task import CampusTask
         from tasks.instance.campus_life_bench.tools import ToolResult
-        from factories.chat_history_item import ChatHistoryItemFactory
-        from typings import TaskName
         
-        # Create a test task instance with minimal factory
-        from pathlib import Path
-        test_data_dir = Path(__file__).parent.parent.parent / "src" / "tasks" / "instance" / "campus_life_bench" / "data"
-
-        # Create a minimal factory (we don't need it for action recording tests)
-        class MockChatHistoryItemFactory:
-            def __init__(self):
-                pass
-
-        task = CampusTask(
-            task_name=TaskName.CAMPUS_LIFE_BENCH,
-            chat_history_item_factory=MockChatHistoryItemFactory(),
-            max_round=10,
-            data_dir=test_data_dir
-        )
+        # Shared task instance; only its action history is per-test state
+        task = _get_task()
+        task.action_history = []
         
         # Test action recording
         test_action = "email.send_email(to='test@example.com', subject='Test Email')"
@@ -9,19 +9,96 @@ import unittest
 import sys
 import os
 import time
+import traceback
 from datetime import datetime
 
-# Add the src directory to Python path
 current_dir = os.path.dirname(os.path.abspath(__file__))
-src_path = os.path.join(current_dir, '..', '..', 'src')
-sys.path.insert(0, src_path)
 
+# comprehensive_action_test_suite puts src/ on the path for the campus_life_bench imports
 from comprehensive_action_test_suite import (
     SingleSystemTests,
     ActionFormatValidationTests,
-    TestDataLoader
+    TestDataLoader,
+    TEST_DATA_DIR
 )
 
+# Tests 2-4 of run_basic_tests: (section title, result label, [(test class, method name)])
+BASIC_TEST_SECTIONS = [
+    ("2️⃣ Testing Action Format Validation", "Action format validation tests", [
+        (ActionFormatValidationTests, 'test_valid_action_formats'),
+        (ActionFormatValidationTests, 'test_invalid_action_formats')
+    ]),
+    ("3️⃣ Testing Single System (Email)", "Email system test", [(SingleSystemTests, 'test_email_system')]),
+    ("4️⃣ Testing Single System (Calendar)", "Calendar system test", [(SingleSystemTests, 'test_calendar_system')]),
+]
+
+SUITE_FILE = os.path.join(current_dir, 'comprehensive_action_test_suite.py')
+
+# Shared by every unittest fallback run; buffer=True only echoes output of failing tests
+_unittest_runner = unittest.TextTestRunner(verbosity=1, stream=sys.stdout, buffer=True)
+
+
+def _test_key(test_class, method_name: str) -> str:
+    """Identifier of a test that is the same for pytest node ids and unittest"""
+    return f"{test_class.__name__}::{method_name}"
+
+
+class _OutcomeCollector:
+    """pytest plugin recording which tests ran and the failures/errors they reported"""
+    
+    def __init__(self):
+        self.outcomes = {}
+    
+    def pytest_runtest_logreport(self, report):
+        problems = self.outcomes.setdefault(report.nodeid.split("::", 1)[-1], [])
+        if report.failed:
+            # Like unittest, only a failed assertion in the test body is a failure
+            crash = getattr(report.longrepr, "reprcrash", None)
+            is_assertion = crash is not None and crash.message.startswith("AssertionError")
+            problems.append(("Failure" if report.when == "call" and is_assertion else "Error", report.longreprtext))
+
+
+def _run_tests(tests: list) -> dict:
+    """Run the given (test class, method name) pairs and map each test key to its problems
+
+    The tests run in a single pytest session, spread over workers when
+    pytest-xdist is installed, with tests that failed last time first.
+    Without pytest they run through unittest. A test missing from the
+    result did not run.
+    """
+    try:
+        import pytest
+    except ImportError:
+        return _run_tests_with_unittest(tests)
+    
+    pytest_args = [f"{SUITE_FILE}::{_test_key(*test)}" for test in tests] + ["-q", "--ff"]
+    try:
+        import xdist  # noqa: F401
+        pytest_args += ["-n", os.environ.get("CLB_WORKERS", "auto")]
+    except ImportError:
+        pass
+    collector = _OutcomeCollector()
+    pytest.main(pytest_args, plugins=[collector])
+    return collector.outcomes
+
+
+def _run_tests_with_unittest(tests: list) -> dict:
+    """unittest fallback for _run_tests: one suite, one runner, one run"""
+    suite = unittest.TestSuite(test_class(method_name) for test_class, method_name in tests)
+    result = _unittest_runner.run(suite)
+    
+    outcomes = {_test_key(*test): [] for test in tests}
+    for kind, problems in (("Failure", result.failures), ("Error", result.errors)):
+        for test, details in problems:
+            if isinstance(test, unittest.TestCase):
+                outcomes[_test_key(type(test), test._testMethodName)].append((kind, details))
+                continue
+            # setUpClass/tearDownClass problems are reported once for the whole class
+            for test_class, method_name in tests:
+                if f"({test_class.__module__}.{test_class.__qualname__})" in str(test):
+                    outcomes[_test_key(test_class, method_name)].append((kind, details))
+    return outcomes
+
 
 class SimpleTestRunner:
     """Simple test runner for debugging"""
@@ -37,8 +114,7 @@ class SimpleTestRunner:
         # Test 1: Data loading
         print("\n1️⃣ Testing Data Loading")
         try:
-            test_data_dir = os.path.join(os.path.dirname(__file__), 'test_data')
-            data_loader = TestDataLoader(test_data_dir)
+            data_loader = TestDataLoader(TEST_DATA_DIR)
             
             # Try to load test data
             single_tests = data_loader.get_test_category("single_system_tests")
@@ -59,77 +135,24 @@ class SimpleTestRunner:
             print(f"   ❌ Data loading failed: {str(e)}")
             return False
         
-        # Test 2: Action format validation
-        print("\n2️⃣ Testing Action Format Validation")
+        # Tests 2-4: action format validation and the email/calendar systems
         try:
-            suite = unittest.TestSuite()
-            suite.addTest(ActionFormatValidationTests('test_valid_action_formats'))
-            suite.addTest(ActionFormatValidationTests('test_invalid_action_formats'))
-            
-            runner = unittest.TextTestRunner(verbosity=1, stream=sys.stdout)
-            result = runner.run(suite)
-            
-            if result.wasSuccessful():
-                print(f"   ✅ Action format validation tests passed")
-            else:
-                print(f"   ❌ Action format validation tests failed")
-                for failure in result.failures:
-                    print(f"      Failure: {failure[1]}")
-                for error in result.errors:
-                    print(f"      Error: {error[1]}")
-                return False
-                
-        except Exception as e:
-            print(f"   ❌ Action format validation failed: {str(e)}")
-            return False
-        
-        # Test 3: Single system test (email only)
-        print("\n3️⃣ Testing Single System (Email)")
-        try:
-            suite = unittest.TestSuite()
-            suite.addTest(SingleSystemTests('test_email_system'))
-            
-            runner = unittest.TextTestRunner(verbosity=1, stream=sys.stdout)
-            result = runner.run(suite)
-            
-            if result.wasSuccessful():
-                print(f"   ✅ Email system test passed")
-            else:
-                print(f"   ❌ Email system test failed")
-                for failure in result.failures:
-                    print(f"      Failure: {failure[1]}")
-                for error in result.errors:
-                    print(f"      Error: {error[1]}")
-                return False
-                
+            outcomes = _run_tests([test for _, _, tests in BASIC_TEST_SECTIONS for test in tests])
         except Exception as e:
-            print(f"   ❌ Email system test failed: {str(e)}")
-            import traceback
+            print(f"   ❌ Running the basic tests failed: {str(e)}")
             traceback.print_exc()
             return False
         
-        # Test 4: Calendar system test
-        print("\n4️⃣ Testing Single System (Calendar)")
-        try:
-            suite = unittest.TestSuite()
-            suite.addTest(SingleSystemTests('test_calendar_system'))
-            
-            runner = unittest.TextTestRunner(verbosity=1, stream=sys.stdout)
-            result = runner.run(suite)
-            
-            if result.wasSuccessful():
-                print(f"   ✅ Calendar system test passed")
+        for title, label, tests in BASIC_TEST_SECTIONS:
+            print(f"\n{title}")
+            problems = [problem for test in tests for problem in outcomes.get(_test_key(*test), [("Error", "test did not run")])]
+            if not problems:
+                print(f"   ✅ {label} passed")
             else:
-                print(f"   ❌ Calendar system test failed")
-                for failure in result.failures:
-                    print(f"      Failure: {failure[1]}")
-                for error in result.errors:
-                    print(f"      Error: {error[1]}")
+                print(f"   ❌ {label} failed")
+                for kind, details in problems:
+                    print(f"      {kind}: {details}")
                 return False
-                
-        except Exception as e:
-            print(f"   ❌ Calendar system test failed: {str(e)}")
-            return False
         
         return True
     
@@ -5,55 +5,88 @@ All natural language communications/returns MUST use English only
 
 import unittest
 import json
-from unittest.mock import Mock, patch
-from src.tasks.instance.campus_life_bench.task import CampusTask, CampusDatasetItem, AgentAction
-from src.tasks.instance.campus_life_bench.action_executor import ActionExecutor
-from src.tasks.instance.campus_life_bench.system_prompt_generator import SystemPromptGenerator
-from src.tasks.instance.campus_life_bench.environment import CampusEnvironment
-from src.tasks.instance.campus_life_bench.tools import ToolResult
+import re
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+if __name__ == "__main__":
+    # Run as a script, so tests/conftest.py has not put src/ on the path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from tasks.instance.campus_life_bench.task import CampusTask, CampusDatasetItem, AgentAction
+from tasks.instance.campus_life_bench.action_executor import ActionExecutor
+from tasks.instance.campus_life_bench.system_prompt_generator import SystemPromptGenerator
+from tasks.instance.campus_life_bench.environment import CampusEnvironment
+from tasks.instance.campus_life_bench.tools import ToolResult
+from factories.chat_history_item import ChatHistoryItemFactory
+from typings import TaskName
+
+CHAT_HISTORY_PATH = Path(__file__).parent / "test_chat_history.json"
+
+# Messages may only contain these English characters
+ENGLISH_ONLY_RE = re.compile(r"\A[A-Za-z0-9 .,!?\-:()\[\]{}\"']*\Z")
+
+VALID_ACTION_RESPONSES = [
+    'Action: email.send_email(to="test@test.com", subject="Test", body="Hello")',
+    'Action: geography.get_current_location()',
+    'Action: finish()',
+    'Action: map.find_building_id(building_name="Library")'
+]
+
+INVALID_ACTION_RESPONSES = [
+    "Just some text without action",
+    "Action: invalid_format",
+    "```python\ncode_block()\n```",  # Old format should be invalid now
+    "Action: (missing_action_name)"
+]
+
+
+def _make_task() -> CampusTask:
+    """A CampusTask over the bundled sample data"""
+    return CampusTask(TaskName.CAMPUS_LIFE_BENCH, ChatHistoryItemFactory(str(CHAT_HISTORY_PATH)))
+
+
+@pytest.mark.parametrize("text", VALID_ACTION_RESPONSES)
+def test_action_parsing_valid_format(text):
+    """Test parsing of valid Action: format"""
+    assert CampusTask._parse_agent_response(text).action in (AgentAction.EXECUTE, AgentAction.FINISH)
+
+
+@pytest.mark.parametrize("text", INVALID_ACTION_RESPONSES)
+def test_action_parsing_invalid_format(text):
+    """Test parsing of invalid formats"""
+    assert CampusTask._parse_agent_response(text).action == AgentAction.INVALID
 
 
 class TestActionSystem(unittest.TestCase):
     """Test the new Action-based execution system"""
     
-    def setUp(self):
-        """Set up test environment"""
-        self.campus_environment = CampusEnvironment()
-        self.prompt_generator = SystemPromptGenerator()
+    @classmethod
+    def setUpClass(cls):
+        """Build the environment and prompt generator once; the tests only read them"""
+        cls.campus_environment = CampusEnvironment()
+        cls.prompt_generator = SystemPromptGenerator()
+        cls._executors = {}
     
-    def test_action_parsing_valid_format(self):
-        """Test parsing of valid Action: format"""
-        test_cases = [
-            'Action: email.send_email(to="test@test.com", subject="Test", body="Hello")',
-            'Action: geography.get_current_location()',
-            'Action: finish()',
-            'Action: map.find_building_id(building_name="Library")'
-        ]
-        
-        for test_case in test_cases:
-            with self.subTest(test_case=test_case):
-                result = CampusTask._parse_agent_response(test_case)
-                self.assertIn(result.action, [AgentAction.EXECUTE, AgentAction.FINISH])
+    def tearDown(self):
+        """Drop emails sent by a test so the shared environment stays clean"""
+        self.campus_environment.email_system.clear_emails()
     
-    def test_action_parsing_invalid_format(self):
-        """Test parsing of invalid formats"""
-        test_cases = [
-            "Just some text without action",
-            "Action: invalid_format",
-            "```python\ncode_block()\n```",  # Old format should be invalid now
-            "Action: (missing_action_name)"
-        ]
-        
-        for test_case in test_cases:
-            with self.subTest(test_case=test_case):
-                result = CampusTask._parse_agent_response(test_case)
-                self.assertEqual(result.action, AgentAction.INVALID)
+    def _executor(self, systems):
+        """One executor per system set for the class (executors hold no per-task state)"""
+        key = tuple(systems)
+        if key not in self._executors:
+            self._executors[key] = ActionExecutor(self.campus_environment, systems)
+        return self._executors[key]
     
     def test_action_executor_system_filtering(self):
         """Test that ActionExecutor only allows actions from available systems"""
         # Test with limited systems
         limited_systems = ["email", "calendar"]
-        executor = ActionExecutor(self.campus_environment, limited_systems)
+        executor = self._executor(limited_systems)
         
         # Should allow email actions
         result = executor.execute_action('email.send_email(to="test@test.com", subject="Test", body="Hello")')
@@ -105,7 +138,7 @@ class TestActionSystem(unittest.TestCase):
     
     def test_task_system_availability_logic(self):
         """Test CampusTask system availability logic"""
-        task = CampusTask()
+        task = _make_task()
         
         # Test with explicit available_systems
         item_with_systems = CampusDatasetItem(
@@ -140,7 +173,7 @@ class TestActionSystem(unittest.TestCase):
     
     def test_action_parameter_parsing(self):
         """Test parameter parsing in ActionExecutor"""
-        executor = ActionExecutor(self.campus_environment, ["email"])
+        executor = self._executor(["email"])
         
         # Test simple string parameters
         action_name, params = executor._parse_action_content(
@@ -155,7 +188,7 @@ class TestActionSystem(unittest.TestCase):
     
     def test_action_validation(self):
         """Test action validation logic"""
-        executor = ActionExecutor(self.campus_environment, ["email", "calendar"])
+        executor = self._executor(["email", "calendar"])
         
         # Test valid actions
         self.assertTrue(executor.is_action_available("email.send_email"))
@@ -173,7 +206,7 @@ class TestActionSystem(unittest.TestCase):
     
     def test_english_only_enforcement(self):
         """Test that all messages are in English only"""
-        executor = ActionExecutor(self.campus_environment, ["email"])
+        executor = self._executor(["email"])
         
         # Execute a valid action
         result = executor.execute_action('email.send_email(to="test@test.com", subject="Test", body="Hello")')
@@ -181,8 +214,7 @@ class TestActionSystem(unittest.TestCase):
         # Check that the message is in English
         self.assertIsInstance(result.message, str)
         # Simple check for English characters only
-        allowed_chars = set("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 .,!?-:()[]{}\"'")
-        self.assertTrue(all(char in allowed_chars for char in result.message))
+        self.assertRegex(result.message, ENGLISH_ONLY_RE)
     
     def test_backward_compatibility(self):
         """Test backward compatibility with finish() format"""
@@ -195,14 +227,35 @@ class TestActionSystem(unittest.TestCase):
         self.assertEqual(result_new.action, AgentAction.FINISH)
 
 
+class _ChatHistoryStub:
+    """List-backed stand-in for a session's chat history"""
+
+    def __init__(self):
+        self.items = []
+
+    def inject(self, item):
+        self.items.append(item)
+
+    add_item = inject
+
+
+class _SessionStub:
+    """Minimal session carrying only what CampusTask._reset touches"""
+
+    def __init__(self):
+        self.chat_history = _ChatHistoryStub()
+        self.output_dir = None
+        self.task_metadata = None
+
+
 class TestSystemIntegration(unittest.TestCase):
     """Test integration between different components"""
     
     def setUp(self):
         """Set up test environment"""
-        self.task = CampusTask()
+        self.task = _make_task()
     
-    @patch('src.tasks.instance.campus_life_bench.task.CampusTask._get_current_dataset_item')
+    @patch('tasks.instance.campus_life_bench.task.CampusTask._get_current_dataset_item')
     def test_full_action_execution_flow(self, mock_get_item):
         """Test the complete flow from task setup to action execution"""
         # Mock dataset item with limited systems
@@ -214,23 +267,20 @@ class TestSystemIntegration(unittest.TestCase):
         )
         mock_get_item.return_value = mock_item
         
-        # Create mock session
-        mock_session = Mock()
-        mock_session.chat_history = Mock()
-        mock_session.chat_history.add_item = Mock()
+        session = _SessionStub()
         
         # Test _reset method (should initialize action executor and add system prompt)
-        self.task._reset(mock_session)
+        self.task._reset(session)
         
         # Verify action executor was initialized
         self.assertIsNotNone(self.task.action_executor)
         self.assertEqual(self.task.action_executor.available_systems, ["email"])
         
         # Verify system prompt was added
-        mock_session.chat_history.add_item.assert_called()
-        call_args = mock_session.chat_history.add_item.call_args[0][0]
-        self.assertIn("Email System Tools", call_args.content)
-        self.assertNotIn("Map & Geography Tools", call_args.content)
+        self.assertTrue(session.chat_history.items)
+        system_prompt = session.chat_history.items[0]["content"]
+        self.assertIn("Email System Tools", system_prompt)
+        self.assertNotIn("Map & Geography Tools", system_prompt)
 
 
 if __name__ == '__main__':
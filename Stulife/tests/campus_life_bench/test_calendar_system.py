@@ -7,12 +7,21 @@ import unittest
 from pathlib import Path
 import sys
 
-# Add the src directory to the path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+if __name__ == "__main__":
+    # Run as a script, so tests/conftest.py has not put src/ on the path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
 
 from tasks.instance.campus_life_bench.systems.world_and_calendar import CalendarSystem, WorldTimeSystem
 from tasks.instance.campus_life_bench.tools import ToolResult, ToolResultStatus
 
+# The Week 1 Monday study session most tests put on the self calendar
+_DEFAULT_EVENT = dict(
+    calendar_id="self",
+    event_title="Study Session",
+    location="Library",
+    time="Week 1, Monday, 14:00-16:00"
+)
+
 
 class TestWorldTimeSystem(unittest.TestCase):
     """Test cases for WorldTimeSystem"""
@@ -46,18 +55,23 @@ class TestWorldTimeSystem(unittest.TestCase):
 class TestCalendarSystem(unittest.TestCase):
     """Test cases for CalendarSystem"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Build one calendar system for the class; setUp resets it per test"""
+        cls.calendar_system = CalendarSystem()
+    
     def setUp(self):
         """Set up test fixtures"""
-        self.calendar_system = CalendarSystem()
+        self.calendar_system.reset()
+    
+    def _add_default_event(self) -> str:
+        """Add the Week 1 Monday study session to the self calendar and return its ID"""
+        result = self.calendar_system.add_event(**_DEFAULT_EVENT)
+        return result.data["event_id"]
     
     def test_add_event_success(self):
         """Test successful event addition"""
-        result = self.calendar_system.add_event(
-            calendar_id="self",
-            event_title="Study Session",
-            location="Library",
-            time="Week 1, Monday, 14:00-16:00"
-        )
+        result = self.calendar_system.add_event(**_DEFAULT_EVENT)
         
         self.assertTrue(result.is_success())
         self.assertIn("successfully added", result.message)
@@ -65,12 +79,7 @@ class TestCalendarSystem(unittest.TestCase):
     
     def test_add_event_missing_parameters(self):
         """Test event addition with missing parameters"""
-        result = self.calendar_system.add_event(
-            calendar_id="self",
-            event_title="",
-            location="Library",
-            time="Week 1, Monday, 14:00-16:00"
-        )
+        result = self.calendar_system.add_event(**{**_DEFAULT_EVENT, "event_title": ""})
         
         self.assertTrue(result.is_failure())
         self.assertIn("required", result.message)
@@ -90,13 +99,7 @@ class TestCalendarSystem(unittest.TestCase):
     def test_remove_event_success(self):
         """Test successful event removal"""
         # First add an event
-        add_result = self.calendar_system.add_event(
-            calendar_id="self",
-            event_title="Study Session",
-            location="Library",
-            time="Week 1, Monday, 14:00-16:00"
-        )
-        event_id = add_result.data["event_id"]
+        event_id = self._add_default_event()
         
         # Then remove it
         remove_result = self.calendar_system.remove_event("self", event_id)
@@ -121,13 +124,7 @@ class TestCalendarSystem(unittest.TestCase):
     def test_update_event_success(self):
         """Test successful event update"""
         # First add an event
-        add_result = self.calendar_system.add_event(
-            calendar_id="self",
-            event_title="Study Session",
-            location="Library",
-            time="Week 1, Monday, 14:00-16:00"
-        )
-        event_id = add_result.data["event_id"]
+        event_id = self._add_default_event()
         
         # Then update it
         update_result = self.calendar_system.update_event(
@@ -149,12 +146,7 @@ class TestCalendarSystem(unittest.TestCase):
     def test_view_schedule_with_events(self):
         """Test viewing schedule with events"""
         # Add an event
-        self.calendar_system.add_event(
-            calendar_id="self",
-            event_title="Study Session",
-            location="Library",
-            time="Week 1, Monday, 14:00-16:00"
-        )
+        self._add_default_event()
         
         # View schedule
         result = self.calendar_system.view_schedule("self", "Week 1, Monday")
@@ -225,17 +217,11 @@ class TestCalendarSystem(unittest.TestCase):
     
     def test_english_only_validation(self):
         """Test that all messages are in English"""
-        result = self.calendar_system.add_event(
-            calendar_id="self",
-            event_title="Study Session",
-            location="Library",
-            time="Week 1, Monday, 14:00-16:00"
-        )
+        result = self.calendar_system.add_event(**_DEFAULT_EVENT)
         
         # Check that message contains only English characters
         message = result.message
-        self.assertTrue(all(ord(char) < 128 for char in message), 
-                       "Message should contain only ASCII characters")
+        self.assertTrue(message.isascii(), "Message should contain only ASCII characters")
 
 
 if __name__ == "__main__":
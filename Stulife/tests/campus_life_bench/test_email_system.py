@@ -7,8 +7,9 @@ import unittest
 from pathlib import Path
 import sys
 
-# Add the src directory to the path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+if __name__ == "__main__":
+    # Run as a script, so tests/conftest.py has not put src/ on the path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
 
 from tasks.instance.campus_life_bench.systems.email import EmailSystem
 from tasks.instance.campus_life_bench.tools import ToolResult, ToolResultStatus
@@ -153,8 +154,7 @@ class TestEmailSystem(unittest.TestCase):
         
         # Check that message contains only English characters
         message = result.message
-        self.assertTrue(all(ord(char) < 128 for char in message), 
-                       "Message should contain only ASCII characters")
+        self.assertTrue(message.isascii(), "Message should contain only ASCII characters")
     
     def test_whitespace_handling(self):
         """Test handling of whitespace in email fields"""
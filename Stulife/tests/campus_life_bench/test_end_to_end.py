@@ -4,93 +4,179 @@ Tests complete workflow with mock agent
 All natural language communications/returns MUST use English only
 """
 
-import unittest
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import List, Optional
 import sys
-import tempfile
 import json
 
-# Add the src directory to the path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+import pytest
 
-from tasks.instance.campus_life_bench.task import CampusTask, CampusDatasetItem
+if __name__ == "__main__":
+    # Run as a script, so tests/conftest.py has not put src/ on the path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from tasks.instance.campus_life_bench.task import CampusTask, CampusDatasetItem, AgentAction
 from tasks.instance.campus_life_bench.environment import CampusEnvironment
-from factories.chat_history_item import ChatHistoryItemFactory
-from typings import Session, SampleStatus, SessionEvaluationRecord, SessionEvaluationOutcome, Role
+from typings import TaskName, Session, SampleStatus, SessionEvaluationRecord, SessionEvaluationOutcome, Role
+
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+except ImportError:
+    def _json_dumps(data) -> bytes:
+        return json.dumps(data, separators=(",", ":")).encode('utf-8')
+
+
+# Golden tasks with known correct answers
+GOLDEN_TASKS = {
+    "golden_001": {
+        "task_id": "golden_001",
+        "task_type": "email_sending",
+        "is_trigger": False,
+        "instruction": "Send an email to your advisor asking about office hours.",
+        "require_time": None,
+        "require_place": None,
+        "source_building_id": None,
+        "world_state_change": [],
+        "details": {
+            "recipient": "advisor@university.edu",
+            "subject": "Office Hours Inquiry",
+            "body": "Dear Professor, could you please let me know your office hours? Thank you."
+        },
+        "ground_truth": {
+            "recipient": "advisor@university.edu",
+            "subject": "Office Hours Inquiry",
+            "body": "Dear Professor, could you please let me know your office hours? Thank you."
+        }
+    },
+    "golden_002": {
+        "task_id": "golden_002",
+        "task_type": "walking_simple",
+        "is_trigger": False,
+        "instruction": "Go to the Grand Central Library for your study session.",
+        "require_time": None,
+        "require_place": None,
+        "source_building_id": "B083",
+        "world_state_change": [],
+        "details": {
+            "target_building": "Grand Central Library",
+            "target_building_id": "B001"
+        },
+        "ground_truth": {
+            "expected_outcome": {
+                "target_location_id": "B001"
+            }
+        }
+    },
+    "golden_003": {
+        "task_id": "golden_003",
+        "task_type": "calendar_management",
+        "is_trigger": False,
+        "instruction": "Add a study group meeting to your calendar.",
+        "require_time": None,
+        "require_place": None,
+        "source_building_id": None,
+        "world_state_change": [],
+        "details": {
+            "calendar_id": "self",
+            "event_title": "Study Group Meeting",
+            "location": "Library Study Room",
+            "time": "Week 1, Wednesday, 15:00-17:00"
+        },
+        "ground_truth": {
+            "event_title": "Study Group Meeting",
+            "location": "Library Study Room",
+            "time": "Week 1, Wednesday, 15:00-17:00"
+        }
+    }
+}
+
+# Map data with the dormitory and the library
+GOLDEN_MAP = {
+    "nodes": [
+        {
+            "id": "B083",
+            "name": "Lakeside Dormitory",
+            "aliases": ["Dorm"],
+            "type": "Residential",
+            "zone": "Residential Area",
+            "internal_amenities": {"floor_1": ["Lobby"]}
+        },
+        {
+            "id": "B001",
+            "name": "Grand Central Library",
+            "aliases": ["Main Library"],
+            "type": "Academic",
+            "zone": "Academic Quad",
+            "internal_amenities": {
+                "floor_1": ["Main Lobby", "Study Areas"],
+                "floor_2": ["Group Study Rooms"]
+            }
+        }
+    ],
+    "edges": [
+        {
+            "source": "B083",
+            "target": "B001",
+            "time_cost": 10,
+            "properties": {"surface": "paved", "rain_exposure": "Covered"}
+        }
+    ],
+    "building_complexes": []
+}
+
+# File contents are serialized once at import and written as-is by every class
+_GOLDEN_FILES = {
+    "tasks.json": _json_dumps(GOLDEN_TASKS),
+    "map_v1.5.json": _json_dumps(GOLDEN_MAP),
+    "bibliography.json": b"{}",
+    "campus_data.json": b"{}",
+    "courses.json": b"{}",
+}
 
 
 class MockOracleAgent:
     """Mock agent that generates correct responses for testing"""
     
-    def __init__(self, task_type: str, ground_truth: dict):
-        self.task_type = task_type
-        self.ground_truth = ground_truth
+    def __init__(self, task: dict):
+        self.task_type = task["task_type"]
+        self.source_building_id = task["source_building_id"]
+        self.details = task["details"]
+        self.ground_truth = task["ground_truth"]
     
-    def generate_response(self) -> str:
-        """Generate correct response based on task type"""
+    def generate_responses(self) -> List[str]:
+        """Correct agent turns for the task; CampusTask runs one Action per turn"""
         if self.task_type == "email_sending":
-            return f"""I'll send the email as requested.
-
-```python
-result = env.send_email(
-    "{self.ground_truth['recipient']}",
-    "{self.ground_truth['subject']}",
-    "{self.ground_truth['body']}"
-)
-finish()
-```"""
+            gt = self.ground_truth
+            return [
+                f'Action: email.send_email(to="{gt["recipient"]}", subject="{gt["subject"]}", body="{gt["body"]}")'
+            ]
         
         elif self.task_type == "walking_simple":
-            return """I need to go to the library. Let me find the path first.
-
-```python
-# Find the library building ID
-building_result = env.find_building_id("Grand Central Library")
-```
-
-```python
-# Find optimal path
-path_result = env.find_optimal_path("B083", "B001")
-```
-
-```python
-# Walk to the library
-walk_result = env.walk_to(path_result.data)
-```
-
-finish()"""
+            source = self.source_building_id
+            target = self.ground_truth["expected_outcome"]["target_location_id"]
+            return [
+                f'Action: map.find_optimal_path(source_building_id="{source}", target_building_id="{target}")',
+                f'Action: geography.walk_to(path_info={{"path": ["{source}", "{target}"]}})'
+            ]
         
         elif self.task_type == "calendar_management":
             gt = self.ground_truth
-            return f"""I'll add the event to my calendar.
-
-```python
-result = env.add_event(
-    "self",
-    "{gt['event_title']}",
-    "{gt['location']}",
-    "{gt['time']}"
-)
-```
-
-finish()"""
+            return [
+                f'Action: calendar.add_event(calendar_id="{self.details["calendar_id"]}", '
+                f'event_title="{gt["event_title"]}", location="{gt["location"]}", time="{gt["time"]}")'
+            ]
         
         else:
-            return "finish()"
+            return ["Action: finish()"]
 
 
-class MockSession:
-    """Enhanced mock session for end-to-end testing"""
-    
-    def __init__(self, sample_index: str):
-        self.sample_index = sample_index
-        self.task_name = "campus_life_bench"
-        self.sample_status = SampleStatus.INITIAL
-        self.finish_reason = None
-        self.task_output = None
-        self.evaluation_record = SessionEvaluationRecord()
-        self.chat_history = MockChatHistory()
-        self.agent_responses = []
+# Oracle turns for the golden tasks, rendered once from their ground truth
+ORACLE_RESPONSES = {
+    task_id: MockOracleAgent(task).generate_responses()
+    for task_id, task in GOLDEN_TASKS.items()
+}
 
 
 class MockChatHistory:
@@ -101,324 +187,279 @@ class MockChatHistory:
     
     def add_item(self, item):
         self.items.append(item)
+
+    def inject(self, item: dict):
+        """Messages CampusTask adds itself (prompts, context, tool results)"""
+        self.items.append(MockChatItem(item["content"], item["role"]))
+
+    def get_value_length(self) -> int:
+        return len(self.items)
     
     def get_item_deep_copy(self, index):
+        """Copy of the last item (the only index CampusTask asks for), else a placeholder"""
         if index == -1 and self.items:
-            return self.items[-1]
-        return MockChatItem("test content")
+            item = self.items[-1]
+            return MockChatItem(item.content, item.role)
+        return _EMPTY_ITEM
 
 
 class MockChatItem:
     """Mock chat item"""
+    
+    __slots__ = ("content", "role")
 
     def __init__(self, content: str, role: Role = Role.AGENT):
         self.content = content
         self.role = role
 
 
-class TestEndToEnd(unittest.TestCase):
-    """End-to-end test cases"""
+# Placeholder returned for missing items; callers only read it
+_EMPTY_ITEM = MockChatItem("test content")
+
+
+@dataclass(slots=True)
+class MockSession:
+    """Enhanced mock session for end-to-end testing, recycled between tests via reset()"""
     
-    def setUp(self):
-        """Set up test fixtures"""
-        # Create temporary data directory
-        self.temp_dir = tempfile.mkdtemp()
-        self.data_dir = Path(self.temp_dir)
-        
-        # Create test data
-        self._create_golden_test_data()
-        
-        # Create task instance with proper chat factory and data directory
-        chat_history_path = Path(__file__).parent / "test_chat_history.json"
-        self.chat_factory = ChatHistoryItemFactory(str(chat_history_path))
+    sample_index: str
+    task_name: str = "campus_life_bench"
+    sample_status: SampleStatus = SampleStatus.INITIAL
+    finish_reason: Optional[str] = None
+    task_output: Optional[dict] = None
+    evaluation_record: SessionEvaluationRecord = field(default_factory=SessionEvaluationRecord)
+    chat_history: MockChatHistory = field(default_factory=MockChatHistory)
+    agent_responses: List[str] = field(default_factory=list)
+    # No output directory, so CampusTask never loads or writes checkpoints
+    output_dir: Optional[str] = None
+    task_metadata: Optional[dict] = None
+
+    def reset(self, sample_index: str) -> "MockSession":
+        """Start over as a fresh session for another sample"""
+        self.sample_index = sample_index
+        self.sample_status = SampleStatus.INITIAL
+        self.finish_reason = None
+        self.task_output = None
+        self.evaluation_record = SessionEvaluationRecord()
+        self.task_metadata = None
+        self.chat_history.items.clear()
+        self.agent_responses.clear()
+        return self
+
+
+@pytest.fixture(scope="module")
+def data_dir(tmp_path_factory):
+    """Golden data files, written once; tasks only read them"""
+    data_dir = tmp_path_factory.mktemp("golden_data")
+    for filename, payload in _GOLDEN_FILES.items():
+        (data_dir / filename).write_bytes(payload)
+    return data_dir
+
+
+@pytest.fixture(scope="module")
+def shared_task(chat_factory, data_dir):
+    """One task for the module; campus_task resets its environment for every test"""
+    return CampusTask(TaskName.CAMPUS_LIFE_BENCH, chat_factory, max_round=10, data_dir=data_dir)
+
+
+@pytest.fixture
+def campus_task(shared_task, mock_session):
+    """The shared task with a freshly reset environment, without reloading any data"""
+    shared_task.campus_environment.reset_for_test()
+    yield shared_task
+    # A test that stops mid-sample would make the next reset() fail its assertions
+    if shared_task.current_sample_index is not None:
+        _complete(shared_task, mock_session)
+
+
+@pytest.fixture(scope="module")
+def mock_session():
+    """One session for the module; tests call reset() with their own sample index"""
+    return MockSession("")
+
+
+@pytest.fixture
+def campus_environment(data_dir):
+    """A bare environment over the golden data, for tests that never use the task layer"""
+    return CampusEnvironment(data_dir)
+
+
+def _complete(task, session):
+    """End the sample as the framework does when the round limit is hit, then evaluate"""
+    session.sample_status = SampleStatus.TASK_LIMIT_REACHED
+    task.complete(session)
+
+
+def _verify_email(environment):
+    """The email went to the advisor with the expected subject"""
+    latest_email = environment.email_system.get_latest_email_for_evaluation()
+    assert latest_email is not None
+    assert latest_email.recipient == "advisor@university.edu"
+    assert latest_email.subject == "Office Hours Inquiry"
+
+
+def _verify_walking(environment):
+    """The agent ended up at the library"""
+    geo_state = environment.geography_system.get_state_for_evaluation()
+    assert geo_state.current_location_id == "B001"
+
+
+def _verify_calendar(environment):
+    """Exactly the study group meeting was added to the self calendar"""
+    events = environment.calendar_system.get_calendar_events_for_evaluation("self")
+    assert len(events) == 1
+    assert events[0].event_title == "Study Group Meeting"
+    assert events[0].location == "Library Study Room"
 
-        # Create task with custom data directory
-        self.task = CampusTask(self.chat_factory, max_round=10, data_dir=self.data_dir)
+
+@pytest.mark.parametrize("task_id, verify", [
+    pytest.param("golden_001", _verify_email, id="email_sending"),
+    pytest.param("golden_002", _verify_walking, id="walking_simple"),
+    pytest.param("golden_003", _verify_calendar, id="calendar_management"),
+])
+def test_golden_workflow(campus_task, mock_session, task_id, verify):
+    """Reset, answer, complete and verify a golden task"""
+    session = mock_session.reset(task_id)
     
-    def _create_golden_test_data(self):
-        """Create golden test data with known correct answers"""
-        self.tasks_data = {
-            "golden_001": {
-                "task_id": "golden_001",
-                "task_type": "email_sending",
-                "is_trigger": False,
-                "instruction": "Send an email to your advisor asking about office hours.",
-                "require_time": None,
-                "require_place": None,
-                "source_building_id": None,
-                "world_state_change": [],
-                "details": {
-                    "recipient": "advisor@university.edu",
-                    "subject": "Office Hours Inquiry",
-                    "body": "Dear Professor, could you please let me know your office hours? Thank you."
-                },
-                "ground_truth": {
-                    "recipient": "advisor@university.edu",
-                    "subject": "Office Hours Inquiry",
-                    "body": "Dear Professor, could you please let me know your office hours? Thank you."
-                }
-            },
-            "golden_002": {
-                "task_id": "golden_002",
-                "task_type": "walking_simple",
-                "is_trigger": False,
-                "instruction": "Go to the Grand Central Library for your study session.",
-                "require_time": None,
-                "require_place": None,
-                "source_building_id": "B083",
-                "world_state_change": [],
-                "details": {
-                    "target_building": "Grand Central Library",
-                    "target_building_id": "B001"
-                },
-                "ground_truth": {
-                    "expected_outcome": {
-                        "target_location_id": "B001"
-                    }
-                }
-            },
-            "golden_003": {
-                "task_id": "golden_003",
-                "task_type": "calendar_management",
-                "is_trigger": False,
-                "instruction": "Add a study group meeting to your calendar.",
-                "require_time": None,
-                "require_place": None,
-                "source_building_id": None,
-                "world_state_change": [],
-                "details": {
-                    "calendar_id": "self",
-                    "event_title": "Study Group Meeting",
-                    "location": "Library Study Room",
-                    "time": "Week 1, Wednesday, 15:00-17:00"
-                },
-                "ground_truth": {
-                    "event_title": "Study Group Meeting",
-                    "location": "Library Study Room",
-                    "time": "Week 1, Wednesday, 15:00-17:00"
-                }
-            }
-        }
-        
-        with open(self.data_dir / "tasks.json", 'w') as f:
-            json.dump(self.tasks_data, f)
-        
-        # Create map data with library
-        map_data = {
-            "nodes": [
-                {
-                    "id": "B083",
-                    "name": "Lakeside Dormitory",
-                    "aliases": ["Dorm"],
-                    "type": "Residential",
-                    "zone": "Residential Area",
-                    "internal_amenities": {"floor_1": ["Lobby"]}
-                },
-                {
-                    "id": "B001",
-                    "name": "Grand Central Library",
-                    "aliases": ["Main Library"],
-                    "type": "Academic",
-                    "zone": "Academic Quad",
-                    "internal_amenities": {
-                        "floor_1": ["Main Lobby", "Study Areas"],
-                        "floor_2": ["Group Study Rooms"]
-                    }
-                }
-            ],
-            "edges": [
-                {
-                    "source": "B083",
-                    "target": "B001",
-                    "time_cost": 10,
-                    "properties": {"surface": "paved", "rain_exposure": "Covered"}
-                }
-            ],
-            "building_complexes": []
-        }
-        
-        with open(self.data_dir / "map_v1.5.json", 'w') as f:
-            json.dump(map_data, f)
-        
-        # Create other minimal data files
-        for filename in ["bibliography.json", "campus_data.json", "courses.json"]:
-            with open(self.data_dir / filename, 'w') as f:
-                json.dump({}, f)
+    # Reset task first
+    campus_task.reset(session)
+    assert session.sample_status == SampleStatus.RUNNING
     
-    def test_email_sending_workflow(self):
-        """Test complete email sending workflow"""
-        session = MockSession("golden_001")
-        
-        # Reset task first
-        self.task.reset(session)
-        self.assertEqual(session.sample_status, SampleStatus.RUNNING)
+    # Simulate the oracle's turns, one interaction each
+    for agent_response in ORACLE_RESPONSES[task_id]:
+        session.chat_history.add_item(MockChatItem(agent_response))
+        campus_task.interact(session)
+    
+    # Complete task
+    _complete(campus_task, session)
+    
+    # Verify correct evaluation and the resulting environment state
+    assert session.evaluation_record.outcome == SessionEvaluationOutcome.CORRECT
+    verify(campus_task.campus_environment)
 
-        # Get task data after reset
-        dataset_item = self.task._get_current_dataset_item()
 
-        # Create oracle agent
-        oracle = MockOracleAgent("email_sending", dataset_item.ground_truth)
-        
-        # Simulate agent response
-        agent_response = oracle.generate_response()
-        session.chat_history.add_item(MockChatItem(agent_response))
-        
-        # Process agent interaction
-        self.task.interact(session)
+def _send_golden_email(environment, gt):
+    environment.send_email(gt["recipient"], gt["subject"], gt["body"])
 
-        # Complete task
-        session.sample_status = SampleStatus.TASK_LIMIT_REACHED
-        self.task.complete(session)
 
-        # Verify correct evaluation
-        self.assertEqual(session.evaluation_record.outcome, SessionEvaluationOutcome.CORRECT)
-        
-        # Verify email was sent correctly
-        latest_email = self.task.campus_environment.email_system.get_latest_email_for_evaluation()
-        self.assertIsNotNone(latest_email)
-        self.assertEqual(latest_email.recipient, "advisor@university.edu")
-        self.assertEqual(latest_email.subject, "Office Hours Inquiry")
+def _add_golden_event(environment, gt):
+    environment.add_event("self", gt["event_title"], gt["location"], gt["time"])
+
+
+@pytest.mark.parametrize("task_id, act, verify", [
+    pytest.param("golden_001", _send_golden_email, _verify_email, id="email_sending"),
+    pytest.param("golden_003", _add_golden_event, _verify_calendar, id="calendar_management"),
+])
+def test_golden_evaluation_direct(campus_task, mock_session, task_id, act, verify):
+    """Evaluation of a golden task whose action is applied straight to the environment, skipping the agent round"""
+    session = mock_session.reset(task_id)
+    campus_task.reset(session)
     
-    def test_walking_workflow(self):
-        """Test complete walking workflow"""
-        session = MockSession("golden_002")
-        
-        # Reset task first
-        self.task.reset(session)
+    act(campus_task.campus_environment, GOLDEN_TASKS[task_id]["ground_truth"])
+    
+    _complete(campus_task, session)
+    
+    assert session.evaluation_record.outcome == SessionEvaluationOutcome.CORRECT
+    verify(campus_task.campus_environment)
 
-        # Get task data after reset
-        dataset_item = self.task._get_current_dataset_item()
 
-        # Create oracle agent
-        oracle = MockOracleAgent("walking_simple", dataset_item.ground_truth)
-        
-        # Test walking with correct format
-        response = '''
-path_result = env.find_optimal_path("B083", "B001")
-if path_result.is_success():
-    walk_result = env.walk_to(path_result.data)
-finish()
-'''
-        session.chat_history.add_item(MockChatItem(f"```python{response}```"))
-        self.task.interact(session)
-        
-        # Complete task
-        session.sample_status = SampleStatus.TASK_LIMIT_REACHED
-        self.task.complete(session)
-        
-        # Verify correct evaluation
-        self.assertEqual(session.evaluation_record.outcome, SessionEvaluationOutcome.CORRECT)
+def test_state_persistence_across_tasks(campus_task, mock_session):
+    """Test that state persists across multiple tasks"""
+    # First task: send email
+    session1 = mock_session.reset("golden_001")
+    campus_task.reset(session1)
+    
+    # Send email
+    campus_task.campus_environment.send_email(
+        "test1@university.edu",
+        "Subject 1",
+        "Body 1"
+    )
+    
+    # Complete first task
+    _complete(campus_task, session1)
 
-        # Verify location was updated
-        geo_state = self.task.campus_environment.geography_system.get_state_for_evaluation()
-        self.assertEqual(geo_state.current_location_id, "B001")
+    # Check that email count persisted (without resetting task)
     
-    def test_calendar_management_workflow(self):
-        """Test complete calendar management workflow"""
-        session = MockSession("golden_003")
-        
-        # Reset task first
-        self.task.reset(session)
+    # Send another email
+    campus_task.campus_environment.send_email(
+        "test2@university.edu",
+        "Subject 2", 
+        "Body 2"
+    )
+    
+    # Verify both emails are in the log
+    emails = campus_task.campus_environment.email_system.get_sent_emails_for_evaluation()
+    assert len(emails) == 2
+    assert emails[0].recipient == "test1@university.edu"
+    assert emails[1].recipient == "test2@university.edu"
 
-        # Get task data after reset
-        dataset_item = self.task._get_current_dataset_item()
 
-        # Create oracle agent
-        oracle = MockOracleAgent("calendar_management", dataset_item.ground_truth)
-        
-        # Simulate agent response
-        agent_response = oracle.generate_response()
-        session.chat_history.add_item(MockChatItem(agent_response))
-        
-        # Process agent interaction
-        self.task.interact(session)
-        
-        # Complete task
-        session.sample_status = SampleStatus.TASK_LIMIT_REACHED
-        self.task.complete(session)
-        
-        # Verify correct evaluation
-        self.assertEqual(session.evaluation_record.outcome, SessionEvaluationOutcome.CORRECT)
-        
-        # Verify event was added correctly
-        events = self.task.campus_environment.calendar_system.get_calendar_events_for_evaluation("self")
-        self.assertEqual(len(events), 1)
-        self.assertEqual(events[0].event_title, "Study Group Meeting")
-        self.assertEqual(events[0].location, "Library Study Room")
+def test_daily_reset_functionality(campus_environment):
+    """Test daily reset functionality"""
+    # Set initial location
+    campus_environment.geography_system.set_location("B001")
     
-    def test_state_persistence_across_tasks(self):
-        """Test that state persists across multiple tasks"""
-        # First task: send email
-        session1 = MockSession("golden_001")
-        self.task.reset(session1)
-        
-        # Send email
-        self.task.campus_environment.send_email(
-            "test1@university.edu",
-            "Subject 1",
-            "Body 1"
-        )
-        
-        # Complete first task
-        session1.sample_status = SampleStatus.TASK_LIMIT_REACHED
-        self.task.complete(session1)
-
-        # Check that email count persisted (without resetting task)
-        
-        # Send another email
-        self.task.campus_environment.send_email(
-            "test2@university.edu",
-            "Subject 2", 
-            "Body 2"
-        )
-        
-        # Verify both emails are in the log
-        emails = self.task.campus_environment.email_system.get_sent_emails_for_evaluation()
-        self.assertEqual(len(emails), 2)
-        self.assertEqual(emails[0].recipient, "test1@university.edu")
-        self.assertEqual(emails[1].recipient, "test2@university.edu")
+    # Verify location is set
+    geo_state = campus_environment.geography_system.get_state_for_evaluation()
+    assert geo_state.current_location_id == "B001"
     
-    def test_daily_reset_functionality(self):
-        """Test daily reset functionality"""
-        # Set initial location
-        self.task.campus_environment.geography_system.set_location("B001")
-        
-        # Verify location is set
-        geo_state = self.task.campus_environment.geography_system.get_state_for_evaluation()
-        self.assertEqual(geo_state.current_location_id, "B001")
-        
-        # Perform daily reset
-        self.task.campus_environment.daily_reset("Week 2, Monday")
-        
-        # Verify location is reset to dormitory
-        geo_state = self.task.campus_environment.geography_system.get_state_for_evaluation()
-        self.assertEqual(geo_state.current_location_id, "B083")
-        self.assertEqual(len(geo_state.walk_history), 0)
+    # Perform daily reset
+    campus_environment.daily_reset("Week 2, Monday")
     
-    def test_error_handling(self):
-        """Test error handling in tool execution"""
-        session = MockSession("golden_001")
-        self.task.reset(session)
-        
-        # Simulate invalid Python code
-        session.chat_history.add_item(MockChatItem("""
-        ```python
-        invalid_syntax = 
-        ```
-        """))
-        
-        # Should handle syntax error gracefully
-        try:
-            self.task.interact(session)
-            # Should not raise exception
-        except Exception as e:
-            self.fail(f"Error handling failed: {e}")
+    # Verify location is reset to dormitory
+    geo_state = campus_environment.geography_system.get_state_for_evaluation()
+    assert geo_state.current_location_id == "B083"
+    assert len(geo_state.walk_history) == 0
+
+
+def test_reset_for_test_restores_initial_state(campus_environment):
+    """reset_for_test undoes emails, events, walks and reservation state, so tests can share one task"""
+    reservation_system = campus_environment.reservation_system
+    campus_environment.send_email("test@university.edu", "Subject", "Body")
+    campus_environment.add_event("self", "Study Group Meeting", "Library Study Room", "Week 1, Wednesday, 15:00-17:00")
+    campus_environment.geography_system.set_location("B001")
+    reservation_system.set_availability({"item_name": "Study Room A", "building_id": "B001", "available_times": ["08:00-10:00"]})
+    reservation_system.set_task_context({"task_id": "reset_check"})
     
-    def tearDown(self):
-        """Clean up test fixtures"""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    campus_environment.reset_for_test()
+    
+    assert campus_environment.email_system.get_sent_emails_for_evaluation() == []
+    assert campus_environment.calendar_system.get_calendar_events_for_evaluation("self") == []
+    assert campus_environment.geography_system.get_state_for_evaluation().current_location_id == "B083"
+    # Reset in place, so references held by callers stay valid
+    assert campus_environment.reservation_system is reservation_system
+    assert reservation_system.get_all_reservations() == []
+    assert reservation_system._configured_availability == {}
+    assert reservation_system._current_task_context is None
+
+
+# Malformed agent output: a Python block instead of an Action: line
+MALFORMED_RESPONSE = """
+    ```python
+    invalid_syntax = 
+    ```
+    """
+
+
+def test_error_handling():
+    """Malformed responses are rejected by the parser, no task setup needed"""
+    result = CampusTask._parse_agent_response(MALFORMED_RESPONSE)
+
+    assert result.action == AgentAction.INVALID
+    assert result.content is None
+
+
+def test_interact_survives_malformed_response(campus_task, mock_session):
+    """interact must not raise on a response the parser rejects"""
+    session = mock_session.reset("golden_001")
+    campus_task.reset(session)
+    session.chat_history.add_item(MockChatItem(MALFORMED_RESPONSE))
+
+    try:
+        campus_task.interact(session)
+    except Exception as e:
+        pytest.fail(f"Error handling failed: {e}")
 
 
 if __name__ == "__main__":
-    unittest.main()
+    sys.exit(pytest.main([__file__]))
@@ -7,11 +7,13 @@ All natural language communications/returns MUST use English only
 import unittest
 from pathlib import Path
 import sys
+import shutil
 import tempfile
 import json
 
-# Add the src directory to the path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+if __name__ == "__main__":
+    # Run as a script, so tests/conftest.py has not put src/ on the path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
 
 from tasks.instance.campus_life_bench.task import CampusTask, CampusDatasetItem
 from tasks.instance.campus_life_bench.environment import CampusEnvironment
@@ -57,24 +59,31 @@ class MockChatItem:
 class TestCampusTaskIntegration(unittest.TestCase):
     """Integration tests for CampusTask"""
     
-    def setUp(self):
-        """Set up test fixtures"""
+    @classmethod
+    def setUpClass(cls):
+        """Write the test data files once; tasks only read them"""
         # Create temporary data directory
-        self.temp_dir = tempfile.mkdtemp()
-        self.data_dir = Path(self.temp_dir)
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.addClassCleanup(shutil.rmtree, cls.temp_dir, ignore_errors=True)
+        cls.data_dir = Path(cls.temp_dir)
         
         # Create minimal test data
-        self._create_test_data()
+        cls._create_test_data()
         
-        # Create task instance with proper chat factory
+        # Create chat factory shared by every task
         chat_history_path = Path(__file__).parent / "test_chat_history.json"
-        self.chat_factory = ChatHistoryItemFactory(str(chat_history_path))
+        cls.chat_factory = ChatHistoryItemFactory(str(chat_history_path))
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        # A fresh task per test, so environment state never leaks between tests
         self.task = CampusTask(self.chat_factory, max_round=5)
         
         # Override data directory
         self.task.campus_environment = CampusEnvironment(self.data_dir)
     
-    def _create_test_data(self):
+    @classmethod
+    def _create_test_data(cls):
         """Create minimal test data files"""
         # Create tasks.json
         tasks_data = {
@@ -100,8 +109,8 @@ class TestCampusTaskIntegration(unittest.TestCase):
             }
         }
         
-        with open(self.data_dir / "tasks.json", 'w') as f:
-            json.dump(tasks_data, f)
+        with open(cls.data_dir / "tasks.json", 'w') as f:
+            json.dump(tasks_data, f, separators=(",", ":"))
         
         # Create minimal map data
         map_data = {
@@ -119,12 +128,12 @@ class TestCampusTaskIntegration(unittest.TestCase):
             "building_complexes": []
         }
         
-        with open(self.data_dir / "map_v1.5.json", 'w') as f:
-            json.dump(map_data, f)
+        with open(cls.data_dir / "map_v1.5.json", 'w') as f:
+            json.dump(map_data, f, separators=(",", ":"))
         
         # Create other minimal data files
         for filename in ["bibliography.json", "campus_data.json", "courses.json"]:
-            with open(self.data_dir / filename, 'w') as f:
+            with open(cls.data_dir / filename, 'w') as f:
                 json.dump({}, f)
     
     def test_task_initialization(self):
@@ -292,11 +301,6 @@ class TestCampusTaskIntegration(unittest.TestCase):
         )
         
         self.assertTrue(all(ord(char) < 128 for char in result.message))
-    
-    def tearDown(self):
-        """Clean up test fixtures"""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
 
 
 if __name__ == "__main__":
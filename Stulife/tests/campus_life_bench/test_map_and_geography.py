@@ -7,9 +7,11 @@ import unittest
 import tempfile
 import json
 from pathlib import Path
-
 import sys
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+if __name__ == "__main__":
+    # Run as a script, so tests/conftest.py has not put src/ on the path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
 
 from tasks.instance.campus_life_bench.systems.map_and_geography import MapLookupSystem, GeographySystem
 
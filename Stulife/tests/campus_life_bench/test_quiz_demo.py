@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Quiz Question Tests for CampusLifeBench Action System
+
+This module tests the quiz question functionality including:
+1. Answer: format parsing
+2. Quiz-specific system prompt generation
+3. Multiple choice question evaluation
+4. Ground truth validation for quiz answers
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+if __name__ == "__main__":
+    # Run as a script, so tests/conftest.py has not put src/ on the path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from tasks.instance.campus_life_bench.task import CampusTask, CampusDatasetItem, AgentAction
+from tasks.instance.campus_life_bench.system_prompt_generator import SystemPromptGenerator
+
+
+QUIZ_SCENARIOS = [
+    {
+        "task_id": "demo_quiz_cs",
+        "task_type": "quiz_question",
+        "is_trigger": False,
+        "instruction": "What is the time complexity of binary search in a sorted array?\nA. O(n)\nB. O(log n)\nC. O(n log n)\nD. O(n²)\nE. O(1)",
+        "available_systems": [],
+        "question_type": "multiple_choice",
+        "answer_format": "Answer: [LETTER]",
+        "options": {
+            "A": "O(n)",
+            "B": "O(log n)", 
+            "C": "O(n log n)",
+            "D": "O(n²)",
+            "E": "O(1)"
+        },
+        "ground_truth": "B",
+        "explanation": "Binary search divides the search space in half with each comparison, resulting in O(log n) time complexity."
+    },
+    {
+        "task_id": "demo_quiz_math",
+        "task_type": "quiz_question", 
+        "is_trigger": False,
+        "instruction": "What is the derivative of f(x) = x³ + 2x² - 5x + 3?\nA. 3x² + 4x - 5\nB. x⁴ + 2x³ - 5x² + 3x\nC. 3x² + 2x - 5\nD. 3x² + 4x + 5\nE. x² + 4x - 5",
+        "available_systems": [],
+        "question_type": "multiple_choice",
+        "answer_format": "Answer: [LETTER]",
+        "options": {
+            "A": "3x² + 4x - 5",
+            "B": "x⁴ + 2x³ - 5x² + 3x", 
+            "C": "3x² + 2x - 5",
+            "D": "3x² + 4x + 5",
+            "E": "x² + 4x - 5"
+        },
+        "ground_truth": "A",
+        "explanation": "The derivative of x³ is 3x², the derivative of 2x² is 4x, the derivative of -5x is -5, and the derivative of a constant is 0."
+    }
+]
+
+
+def setup_quiz_inputs():
+    """Flat (case id, answer, accepted letter or None, ground truth) tuples for every quiz
+
+    The inputs are fixed strings, so the list is the same on every run and
+    building it is kept apart from the parsing being measured.
+    """
+    inputs = []
+    for quiz_scenario in QUIZ_SCENARIOS:
+        task_id = quiz_scenario["task_id"]
+        ground_truth = quiz_scenario["ground_truth"]
+        wrong_letter = chr(ord(ground_truth) + 1)
+        inputs += [
+            (f"{task_id}-correct", f"Answer: {ground_truth}", ground_truth, ground_truth),
+            (f"{task_id}-invalid_letter", "Answer: Z", None, ground_truth),
+            (f"{task_id}-wrong_answer", f"Answer: {wrong_letter}", wrong_letter, ground_truth),
+            (f"{task_id}-free_text", "I think the answer is B", None, ground_truth),
+            (f"{task_id}-no_prefix", f"The correct answer is {ground_truth}", None, ground_truth),
+        ]
+    return inputs
+
+
+QUIZ_INPUTS = setup_quiz_inputs()
+
+
+def run_parse(inputs):
+    """Parse every answer in one loop; returns the results and the elapsed time in ns"""
+    parse = CampusTask._parse_agent_response
+    answers = [answer for _, answer, _, _ in inputs]
+    start = time.perf_counter_ns()
+    parsed = [parse(answer) for answer in answers]
+    return parsed, time.perf_counter_ns() - start
+
+
+def _accepted_letter(parsed):
+    """Letter of an accepted quiz answer, or None when the response was rejected"""
+    if parsed.action == AgentAction.FINISH and parsed.finish_reason == "quiz_answer":
+        return parsed.content.replace("Answer: ", "").strip().upper()
+    return None
+
+
+def report(parsed, inputs, elapsed_ns):
+    """One-line summary of a run_parse batch"""
+    letters = [_accepted_letter(result) for result in parsed]
+    accepted = sum([letter is not None for letter in letters])
+    correct = sum([letter == ground_truth for letter, (_, _, _, ground_truth) in zip(letters, inputs)])
+    return (f"Parsed {len(inputs)} quiz answers in {elapsed_ns / 1000:.1f} us: "
+            f"{accepted} accepted, {correct} correct")
+
+
+@pytest.fixture(scope="module")
+def prompt_generator():
+    """Prompt generator shared by the module"""
+    return SystemPromptGenerator()
+
+
+@pytest.mark.parametrize("quiz_scenario", QUIZ_SCENARIOS, ids=lambda scenario: scenario["task_id"])
+def test_quiz_prompt(prompt_generator, quiz_scenario):
+    """Quiz dataset items get a prompt with the Answer: format instruction"""
+    dataset_item = CampusDatasetItem(**quiz_scenario)
+    system_prompt = prompt_generator.generate_prompt(dataset_item.available_systems, task_type="quiz_question")
+
+    assert "Answer: [LETTER]" in system_prompt
+
+
+@pytest.mark.parametrize(
+    "test_answer, expected_letter, ground_truth",
+    [pytest.param(*case, id=case_id) for case_id, *case in QUIZ_INPUTS]
+)
+def test_quiz_answer_parsing(test_answer, expected_letter, ground_truth):
+    """Only Answer: [A-E] responses are accepted, and graded against the ground truth"""
+    agent_answer = _accepted_letter(CampusTask._parse_agent_response(test_answer))
+
+    assert agent_answer == expected_letter, f"{test_answer!r} parsed as {agent_answer!r}"
+    assert (agent_answer == ground_truth) == (expected_letter == ground_truth)
+
+
+def test_batch_parse():
+    """A batch parse gives the same letters as parsing each answer on its own"""
+    parsed, _ = run_parse(QUIZ_INPUTS)
+
+    assert [_accepted_letter(result) for result in parsed] == [letter for _, _, letter, _ in QUIZ_INPUTS]
+
+
+if __name__ == "__main__":
+    parsed, elapsed_ns = run_parse(QUIZ_INPUTS)
+    print(report(parsed, QUIZ_INPUTS, elapsed_ns))
@@ -0,0 +1,15 @@
+"""
+Root pytest configuration for the Stulife tests
+Puts src/ on the import path once, before any test module is imported
+"""
+
+import sys
+from pathlib import Path
+
+SRC_PATH = Path(__file__).resolve().parents[1] / "src"
+
+
+def pytest_configure(config):
+    """Make the src/ packages importable from every test module and worker"""
+    if str(SRC_PATH) not in sys.path:
+        sys.path.insert(0, str(SRC_PATH))
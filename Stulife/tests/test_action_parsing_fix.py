@@ -141,6 +141,15 @@ class TestActionParsingFix(unittest.TestCase):
         self.assertEqual(result.action, AgentAction.INVALID)
         print("✅ 无效Action格式正确识别")
 
+    def test_action_without_tool_name(self):
+        """测试缺少工具名的Action被识别为无效（修复前返回EXECUTE）"""
+        for agent_response in ('Action: (missing_action_name)', '<action>Action: (section_id="GFJ003111100(2)")</action>'):
+            result = CampusTask._parse_agent_response(agent_response)
+
+            self.assertEqual(result.action, AgentAction.INVALID)
+            self.assertIsNone(result.content)
+        print("✅ 缺少工具名的Action正确识别为无效")
+
 
 def run_comprehensive_test():
     """运行全面的测试"""